@@ -1,14 +1,189 @@
 """Field extractor module for FNOL documents.
 
 This module handles extraction of structured fields from raw FNOL text using
-Google Gemini API with fallback to heuristic-based extraction.
+heuristic-based extraction, with Google Gemini API filling any mandatory
+fields the heuristic cannot find.
 """
 
 import os
-import json
+import asyncio
+import copy
+import hashlib
 import re
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
+import orjson
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+from app.router_rules import MANDATORY_FIELDS_PARSED
+
+
+def _compile(*patterns: str) -> tuple[re.Pattern, ...]:
+    """Compile heuristic patterns once at import, case-insensitive."""
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+
+# Heuristic field patterns, tried in order (first match wins). Captures
+# that follow a [\s:]+ separator must not start with whitespace themselves,
+# otherwise a long whitespace run makes matching quadratic. Each group
+# stays a tuple of separate patterns rather than one alternation: an
+# alternation returns the leftmost match of any branch, which would let a
+# generic pattern (e.g. any date) beat a labeled one found later in the
+# text, and it is slower under CPython's re because the per-pattern
+# literal-prefix scan is lost.
+POLICY_PATTERNS = _compile(
+    r'Policy\s*(?:Number|#|No\.?)[\s:]+([A-Z0-9-]+)',
+    r'Policy[\s:]+([A-Z0-9-]+)',
+)
+
+NAME_PATTERNS = _compile(
+    r'Policyholder[\s:]+([A-Za-z][A-Za-z\s]*?)(?:\n|,|Policy)',
+    r'Insured[\s:]+([A-Za-z][A-Za-z\s]*?)(?:\n|,)',
+)
+
+DATE_PATTERNS = _compile(
+    r'(?:Incident|Loss|Accident)\s*Date[\s:]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'Date\s*of\s*(?:Incident|Loss|Accident)[\s:]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
+    r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',  # Generic date
+)
+
+TIME_PATTERNS = _compile(
+    r'(?:Incident|Loss|Accident)\s*Time[\s:]+(\d{1,2}:\d{2}(?:\s*[AP]M)?)',
+    r'Time[\s:]+(\d{1,2}:\d{2}(?:\s*[AP]M)?)',
+)
+
+LOCATION_PATTERNS = _compile(
+    r'Location[\s:]+([^\n]+)',
+    r'(?:Incident|Accident)\s*Location[\s:]+([^\n]+)',
+)
+
+DESC_PATTERNS = _compile(
+    r'Description[\s:]+([^\n]+(?:\n(?!\w+:)[^\n]+)*)',
+    r'Incident\s*Description[\s:]+([^\n]+(?:\n(?!\w+:)[^\n]+)*)',
+)
+
+CLAIMANT_PATTERNS = _compile(
+    r'Claimant[\s:]+([A-Za-z][A-Za-z\s]*?)(?:\n|,)',
+)
+
+CONTACT_PATTERNS = _compile(
+    r'Contact[\s:]+([^\n]+)',
+    r'Phone[\s:]+([^\n]+)',
+    r'Email[\s:]+([^\n]+)',
+)
+
+DAMAGE_PATTERNS = _compile(
+    r'Estimated\s*Damage[\s:]+\$?([\d,]+(?:\.\d{2})?)',
+    r'Damage[\s:]+\$?([\d,]+(?:\.\d{2})?)',
+    r'Loss\s*Amount[\s:]+\$?([\d,]+(?:\.\d{2})?)',
+)
+
+CLAIM_TYPE_PATTERNS = _compile(
+    r'Claim\s*Type[\s:]+([A-Za-z]+)',
+    r'Type\s*of\s*Claim[\s:]+([A-Za-z]+)',
+)
+
+ASSET_PATTERNS = _compile(
+    r'Asset\s*Type[\s:]+([^\n]+)',
+    r'Vehicle\s*Type[\s:]+([^\n]+)',
+)
+
+# Asset ID (VIN, license plate, etc.)
+ASSET_ID_PATTERNS = _compile(
+    r'(?:VIN|Vehicle\s*ID)[\s:]+([A-Z0-9]+)',
+    r'License\s*Plate[\s:]+([A-Z0-9-]+)',
+    r'Asset\s*ID[\s:]+([A-Z0-9-]+)',
+)
+
+
+# Gemini responses keyed by SHA-256 digest of the whitespace-normalized
+# document text. Extraction runs at temperature=0, so identical input
+# yields identical output. Entries are stored as compact JSON bytes, about
+# a quarter of the size of the equivalent nested dict.
+GEMINI_CACHE_SIZE = 512
+GEMINI_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+_GEMINI_CACHE: "OrderedDict[bytes, tuple[float, bytes]]" = OrderedDict()
+_GEMINI_CACHE_LOCK = threading.Lock()
+
+# Bulk extraction: concurrent Gemini requests and retry policy for
+# rate limiting (429) and transient unavailability (503/504)
+GEMINI_MAX_CONCURRENCY = 5
+GEMINI_MAX_RETRIES = 3
+GEMINI_RETRY_BASE_DELAY = 1.0  # seconds, doubled on each retry
+
+_RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.DeadlineExceeded,
+)
+
+
+# Shared Gemini client, created lazily by _configure_gemini
+_MODEL: Optional[genai.GenerativeModel] = None
+_MODEL_API_KEY: Optional[str] = None
+_MODEL_LOCK = threading.Lock()
+
+_NULLABLE_STRING = {"type": "string", "nullable": True}
+_NULLABLE_NUMBER = {"type": "number", "nullable": True}
+_NULLABLE_STRING_LIST = {"type": "array", "items": {"type": "string"}, "nullable": True}
+
+# JSON-mode response schema mirroring ExtractedFields
+EXTRACTED_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "policyInformation": {
+            "type": "object",
+            "properties": {
+                "policyNumber": _NULLABLE_STRING,
+                "policyholderName": _NULLABLE_STRING,
+                "effectiveDates": _NULLABLE_STRING,
+            },
+        },
+        "incidentInformation": {
+            "type": "object",
+            "properties": {
+                "date": _NULLABLE_STRING,
+                "time": _NULLABLE_STRING,
+                "location": _NULLABLE_STRING,
+                "description": _NULLABLE_STRING,
+            },
+        },
+        "involvedParties": {
+            "type": "object",
+            "properties": {
+                "claimant": _NULLABLE_STRING,
+                "thirdParties": _NULLABLE_STRING_LIST,
+                "contactDetails": _NULLABLE_STRING,
+            },
+        },
+        "assetDetails": {
+            "type": "object",
+            "properties": {
+                "assetType": _NULLABLE_STRING,
+                "assetId": _NULLABLE_STRING,
+                "estimatedDamage": _NULLABLE_NUMBER,
+            },
+        },
+        "claimType": _NULLABLE_STRING,
+        "attachments": _NULLABLE_STRING_LIST,
+        "initialEstimate": _NULLABLE_NUMBER,
+    },
+}
+
+# Generation settings for deterministic extraction; JSON mode guarantees
+# the reply is bare JSON in the EXTRACTED_SCHEMA shape
+_GENERATION_CONFIG = genai.GenerationConfig(
+    temperature=0,  # Deterministic extraction
+    max_output_tokens=2048,
+    response_mime_type="application/json",
+    response_schema=EXTRACTED_SCHEMA,
+)
+
+# The schema carries the structure, so the prompt only states the rules
+_PROMPT_PREFIX = "Extract FNOL fields from this document. Use null for anything not stated; do not guess.\n"
 
 
 class ExtractionError(Exception):
@@ -22,28 +197,94 @@ class GeminiAPIError(ExtractionError):
 
 
 def _configure_gemini() -> Optional[genai.GenerativeModel]:
-    """Configure and return Gemini API client.
+    """Return the shared Gemini API client, creating it on first use.
     
-    Uses gemini-1.5-flash model for cost-effective extraction.
+    Uses gemini-1.5-flash model for cost-effective extraction. The client is
+    built once per process (and rebuilt only if GEMINI_API_KEY changes)
+    instead of on every extraction.
     
     Returns:
         Configured GenerativeModel instance or None if API key not available
         
     Requirements: 5.1, 5.5
     """
+    global _MODEL, _MODEL_API_KEY
+    
     api_key = os.getenv('GEMINI_API_KEY')
     if not api_key:
         return None
     
-    genai.configure(api_key=api_key)
-    return genai.GenerativeModel('gemini-1.5-flash')
+    with _MODEL_LOCK:
+        if _MODEL is None or _MODEL_API_KEY != api_key:
+            genai.configure(api_key=api_key)
+            _MODEL = genai.GenerativeModel('gemini-1.5-flash')
+            _MODEL_API_KEY = api_key
+        return _MODEL
+
+
+def _cache_key(text: str) -> bytes:
+    """Return the Gemini cache key for a document.
+    
+    Whitespace is collapsed before hashing so copies of a document that
+    differ only in line endings, indentation or trailing blanks (e.g. the
+    TXT and PDF renderings of the same FNOL) share one cache entry.
+    """
+    normalized = ' '.join(text.split())
+    return hashlib.sha256(normalized.encode('utf-8')).digest()
+
+
+def _cache_get(key: bytes) -> Optional[dict]:
+    """Return a cached extraction, or None if absent or expired."""
+    with _GEMINI_CACHE_LOCK:
+        entry = _GEMINI_CACHE.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, encoded = entry
+        if expires_at <= time.monotonic():
+            del _GEMINI_CACHE[key]
+            return None
+        
+        _GEMINI_CACHE.move_to_end(key)
+    
+    # Decoding yields a fresh dict, so callers cannot mutate the entry
+    return orjson.loads(encoded)
+
+
+def _cache_put(key: bytes, extracted: dict) -> None:
+    """Store an extraction, evicting the least recently used entry if full."""
+    encoded = orjson.dumps(extracted)
+    with _GEMINI_CACHE_LOCK:
+        _GEMINI_CACHE[key] = (time.monotonic() + GEMINI_CACHE_TTL, encoded)
+        _GEMINI_CACHE.move_to_end(key)
+        while len(_GEMINI_CACHE) > GEMINI_CACHE_SIZE:
+            _GEMINI_CACHE.popitem(last=False)
+
+
+def _build_prompt(text: str) -> str:
+    """Build the extraction prompt for a document."""
+    return _PROMPT_PREFIX + text
+
+
+def _parse_gemini_response(response_text: str) -> dict:
+    """Parse Gemini's JSON-mode reply.
+    
+    Raises:
+        GeminiAPIError: If the response is not valid JSON (e.g. truncated)
+    """
+    try:
+        return orjson.loads(response_text)
+    except orjson.JSONDecodeError as e:
+        raise GeminiAPIError(f"Invalid JSON response from Gemini: {str(e)}")
 
 
 def extract_fields_with_gemini(text: str) -> dict:
     """Use Gemini to extract structured fields from FNOL text.
     
-    Sends structured prompt requesting JSON extraction. Uses temperature=0
-    for deterministic results. Handles markdown-wrapped JSON responses.
+    Requests JSON-mode output constrained to EXTRACTED_SCHEMA. Uses
+    temperature=0 for deterministic results.
+    Successful responses are cached by content hash, so resubmitting the
+    same document does not trigger another API call.
     
     Args:
         text: Raw FNOL document text
@@ -56,98 +297,126 @@ def extract_fields_with_gemini(text: str) -> dict:
                        
     Requirements: 5.1, 5.2, 5.3, 5.4
     """
+    key = _cache_key(text)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    
     model = _configure_gemini()
     if not model:
         raise GeminiAPIError("GEMINI_API_KEY environment variable not set")
     
-    # Create structured prompt for field extraction
-    prompt = f"""Extract the following fields from this FNOL (First Notice of Loss) document and return ONLY valid JSON.
-
-Required JSON structure:
-{{
-  "policyInformation": {{
-    "policyNumber": "string or null",
-    "policyholderName": "string or null",
-    "effectiveDates": "string or null"
-  }},
-  "incidentInformation": {{
-    "date": "string or null",
-    "time": "string or null",
-    "location": "string or null",
-    "description": "string or null"
-  }},
-  "involvedParties": {{
-    "claimant": "string or null",
-    "thirdParties": ["string"] or null,
-    "contactDetails": "string or null"
-  }},
-  "assetDetails": {{
-    "assetType": "string or null",
-    "assetId": "string or null",
-    "estimatedDamage": number or null
-  }},
-  "claimType": "string or null",
-  "attachments": ["string"] or null,
-  "initialEstimate": number or null
-}}
-
-Rules:
-- Use null for any field you cannot find in the document
-- Do not invent or guess values
-- Use exact field names as shown (camelCase)
-- For monetary values (estimatedDamage, initialEstimate), extract only the numeric value without currency symbols
-- For thirdParties and attachments, use null if not found, or an array of strings if found
-- Return only JSON, no additional text or markdown formatting
-
-Document text:
-{text}
-"""
-    
     try:
         # Generate response with timeout
         response = model.generate_content(
-            prompt,
-            generation_config=genai.GenerationConfig(
-                temperature=0,  # Deterministic extraction
-                max_output_tokens=2048,
-            ),
+            _build_prompt(text),
+            generation_config=_GENERATION_CONFIG,
             request_options={'timeout': 25}
         )
+        extracted = _parse_gemini_response(response.text)
         
-        # Extract JSON from response
-        response_text = response.text.strip()
-        
-        # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            # Remove ```json or ``` at start and ``` at end
-            response_text = re.sub(r'^```(?:json)?\s*\n', '', response_text)
-            response_text = re.sub(r'\n```\s*$', '', response_text)
-        
-        # Parse JSON
-        extracted = json.loads(response_text)
-        return extracted
-        
-    except json.JSONDecodeError as e:
-        raise GeminiAPIError(f"Invalid JSON response from Gemini: {str(e)}")
+    except GeminiAPIError:
+        raise
     except Exception as e:
         raise GeminiAPIError(f"Gemini API error: {str(e)}")
+    
+    _cache_put(key, extracted)
+    return extracted
 
 
-def extract_fields_heuristic(text: str) -> dict:
-    """Fallback regex/keyword-based extraction.
+async def _extract_with_gemini_async(
+    model: genai.GenerativeModel,
+    text: str,
+    semaphore: asyncio.Semaphore
+) -> dict:
+    """Async counterpart of extract_fields_with_gemini for bulk runs.
     
-    This is a simple heuristic approach that looks for common patterns
-    in FNOL documents. Less accurate than LLM extraction but provides
-    graceful degradation.
+    Limits in-flight requests with the shared semaphore and retries with
+    exponential backoff when Gemini rate-limits or times out.
+    
+    Raises:
+        GeminiAPIError: If Gemini fails after all retries or returns invalid JSON
+    """
+    key = _cache_key(text)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    
+    async with semaphore:
+        for attempt in range(GEMINI_MAX_RETRIES + 1):
+            try:
+                response = await model.generate_content_async(
+                    _build_prompt(text),
+                    generation_config=_GENERATION_CONFIG,
+                    request_options={'timeout': 25}
+                )
+                extracted = _parse_gemini_response(response.text)
+                break
+                
+            except GeminiAPIError:
+                raise
+            except _RETRYABLE_ERRORS as e:
+                if attempt == GEMINI_MAX_RETRIES:
+                    raise GeminiAPIError(f"Gemini API error after retries: {str(e)}")
+                await asyncio.sleep(GEMINI_RETRY_BASE_DELAY * 2 ** attempt)
+            except Exception as e:
+                raise GeminiAPIError(f"Gemini API error: {str(e)}")
+    
+    _cache_put(key, extracted)
+    return extracted
+
+
+async def extract_fields_batch(texts: list[str]) -> list[dict]:
+    """Extract fields from many documents concurrently.
+    
+    Each document goes through the same heuristic-then-Gemini flow as
+    extract_fields, with at most GEMINI_MAX_CONCURRENCY Gemini requests in
+    flight at once.
     
     Args:
-        text: Raw FNOL document text
+        texts: Raw FNOL document texts
         
     Returns:
-        Dictionary containing extracted fields (many may be null)
+        Extracted field dictionaries, in the same order as texts
+        
+    Raises:
+        ExtractionError: If both Gemini and heuristic extraction fail
+                         for any document
     """
-    # Initialize structure with all nulls
-    extracted = {
+    model = _configure_gemini()
+    semaphore = asyncio.Semaphore(GEMINI_MAX_CONCURRENCY)
+    
+    async def extract_one(text: str) -> dict:
+        heuristic = None
+        heuristic_error = None
+        try:
+            # CPU-bound; keep it off the event loop
+            heuristic = await asyncio.to_thread(extract_fields_heuristic, text)
+        except Exception as e:
+            heuristic_error = e
+        
+        if heuristic is not None and not _missing_mandatory(heuristic):
+            return heuristic
+        
+        if model is not None:
+            try:
+                gemini = await _extract_with_gemini_async(model, text, semaphore)
+            except GeminiAPIError:
+                # Keep whatever the heuristic found
+                pass
+            else:
+                return gemini if heuristic is None else _merge(heuristic, gemini)
+        
+        if heuristic is None:
+            raise ExtractionError(f"All extraction methods failed: {str(heuristic_error)}")
+        return heuristic
+    
+    return list(await asyncio.gather(*(extract_one(text) for text in texts)))
+
+
+def _empty_extraction() -> dict:
+    """Return the extraction schema with every field set to null."""
+    return {
         "policyInformation": {
             "policyNumber": None,
             "policyholderName": None,
@@ -173,154 +442,295 @@ def extract_fields_heuristic(text: str) -> dict:
         "attachments": None,
         "initialEstimate": None
     }
+
+
+def _parse_amount(amount_str: str) -> Optional[float]:
+    """Convert a captured currency amount (e.g. "5,000.00") to float."""
+    try:
+        return float(amount_str.replace(',', ''))
+    except ValueError:
+        return None
+
+
+def _parse_claim_type(claim_type: str) -> str:
+    """Normalize a captured claim type to lowercase."""
+    return claim_type.strip().lower()
+
+
+# Field path -> (fallback patterns, value converter).
+# Dict order is the order fields are resolved in.
+FIELD_RULES = {
+    "policyInformation.policyNumber": (POLICY_PATTERNS, str.strip),
+    "policyInformation.policyholderName": (NAME_PATTERNS, str.strip),
+    "incidentInformation.date": (DATE_PATTERNS, str.strip),
+    "incidentInformation.time": (TIME_PATTERNS, str.strip),
+    "incidentInformation.location": (LOCATION_PATTERNS, str.strip),
+    "incidentInformation.description": (DESC_PATTERNS, str.strip),
+    "involvedParties.claimant": (CLAIMANT_PATTERNS, str.strip),
+    "involvedParties.contactDetails": (CONTACT_PATTERNS, str.strip),
+    "assetDetails.estimatedDamage": (DAMAGE_PATTERNS, _parse_amount),
+    "claimType": (CLAIM_TYPE_PATTERNS, _parse_claim_type),
+    "assetDetails.assetType": (ASSET_PATTERNS, str.strip),
+    "assetDetails.assetId": (ASSET_ID_PATTERNS, str.strip),
+}
+
+# Case-sensitive, lowercased twins of the fallback patterns, matched
+# against a lowercased copy of ASCII documents. Without IGNORECASE the
+# regex engine can jump straight to each pattern's literal prefix instead
+# of case-folding every character. Lowercasing the source is safe because
+# the patterns use no uppercase escapes (\S, \W, \D, ...).
+_LOWER_PATTERNS = {
+    pattern: re.compile(pattern.pattern.lower())
+    for patterns, _ in FIELD_RULES.values()
+    for pattern in patterns
+}
+
+# Normalized "Key:" label -> (field path, rank). Lower rank wins when a
+# document carries several labels for the same field.
+LINE_LABELS = {
+    "policy number": ("policyInformation.policyNumber", 0),
+    "policy #": ("policyInformation.policyNumber", 0),
+    "policy no": ("policyInformation.policyNumber", 0),
+    "policy no.": ("policyInformation.policyNumber", 0),
+    "policy": ("policyInformation.policyNumber", 1),
+    "policyholder": ("policyInformation.policyholderName", 0),
+    "policyholder name": ("policyInformation.policyholderName", 0),
+    "insured": ("policyInformation.policyholderName", 1),
+    "insured name": ("policyInformation.policyholderName", 1),
+    "incident date": ("incidentInformation.date", 0),
+    "loss date": ("incidentInformation.date", 0),
+    "accident date": ("incidentInformation.date", 0),
+    "date of incident": ("incidentInformation.date", 1),
+    "date of loss": ("incidentInformation.date", 1),
+    "date of accident": ("incidentInformation.date", 1),
+    "incident time": ("incidentInformation.time", 0),
+    "loss time": ("incidentInformation.time", 0),
+    "accident time": ("incidentInformation.time", 0),
+    "time of incident": ("incidentInformation.time", 0),
+    "time": ("incidentInformation.time", 1),
+    "location": ("incidentInformation.location", 0),
+    "incident location": ("incidentInformation.location", 0),
+    "accident location": ("incidentInformation.location", 0),
+    "description": ("incidentInformation.description", 0),
+    "incident description": ("incidentInformation.description", 0),
+    "claimant": ("involvedParties.claimant", 0),
+    "claimant name": ("involvedParties.claimant", 0),
+    "contact": ("involvedParties.contactDetails", 0),
+    "contact details": ("involvedParties.contactDetails", 0),
+    "contact information": ("involvedParties.contactDetails", 0),
+    "phone": ("involvedParties.contactDetails", 1),
+    "email": ("involvedParties.contactDetails", 2),
+    "estimated damage": ("assetDetails.estimatedDamage", 0),
+    "damage": ("assetDetails.estimatedDamage", 1),
+    "loss amount": ("assetDetails.estimatedDamage", 2),
+    "claim type": ("claimType", 0),
+    "type of claim": ("claimType", 1),
+    "asset type": ("assetDetails.assetType", 0),
+    "vehicle type": ("assetDetails.assetType", 1),
+    "vin": ("assetDetails.assetId", 0),
+    "vehicle id": ("assetDetails.assetId", 0),
+    "license plate": ("assetDetails.assetId", 1),
+    "asset id": ("assetDetails.assetId", 2),
+}
+
+# Accepted shape of a labeled value, matched from the start of the value
+# and ending at a token boundary: a value that only partly fits (e.g.
+# "14:05" as a damage amount) is rejected and left to the FIELD_RULES cascade
+_VALUE_END = r'(?=\s|,|$)'
+
+LINE_VALUE_PATTERNS = {
+    "policyInformation.policyNumber": re.compile(r'([A-Z0-9-]+)' + _VALUE_END, re.IGNORECASE),
+    "policyInformation.policyholderName": re.compile(r'([A-Za-z][A-Za-z\s]*?)(?:,|$)'),
+    "incidentInformation.date": re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})' + _VALUE_END),
+    "incidentInformation.time": re.compile(r'(\d{1,2}:\d{2}(?:\s*[AP]M)?)' + _VALUE_END, re.IGNORECASE),
+    "incidentInformation.location": re.compile(r'(.+)'),
+    "incidentInformation.description": re.compile(r'(.+)'),
+    "involvedParties.claimant": re.compile(r'([A-Za-z][A-Za-z\s]*?)(?:,|$)'),
+    "involvedParties.contactDetails": re.compile(r'(.+)'),
+    "assetDetails.estimatedDamage": re.compile(r'\$?([\d,]+(?:\.\d{2})?)' + _VALUE_END),
+    "claimType": re.compile(r'([A-Za-z]+)' + _VALUE_END),
+    "assetDetails.assetType": re.compile(r'(.+)'),
+    "assetDetails.assetId": re.compile(
+        r'(?:(?:VIN|Vehicle\s*ID)[\s:]+)?([A-Z0-9-]+)' + _VALUE_END, re.IGNORECASE
+    ),
+}
+
+# A single-word "Key:" line that is not a known label (e.g. "Witness:")
+# also ends a multi-line description, as the cascade's (?!\w+:) does
+_SINGLE_WORD_KEY = re.compile(r'[A-Za-z]\w*')
+
+
+def _is_label_line(line: str) -> bool:
+    """Return True if a line opens a new "Key:" entry.
     
-    # Policy number patterns
-    policy_patterns = [
-        r'Policy\s*(?:Number|#|No\.?)[\s:]+([A-Z0-9-]+)',
-        r'Policy[\s:]+([A-Z0-9-]+)',
-    ]
-    for pattern in policy_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["policyInformation"]["policyNumber"] = match.group(1).strip()
-            break
-    
-    # Policyholder name
-    name_patterns = [
-        r'Policyholder[\s:]+([A-Za-z\s]+?)(?:\n|,|Policy)',
-        r'Insured[\s:]+([A-Za-z\s]+?)(?:\n|,)',
-    ]
-    for pattern in name_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["policyInformation"]["policyholderName"] = match.group(1).strip()
-            break
-    
-    # Incident date patterns
-    date_patterns = [
-        r'(?:Incident|Loss|Accident)\s*Date[\s:]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        r'Date\s*of\s*(?:Incident|Loss|Accident)[\s:]+(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',
-        r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})',  # Generic date
-    ]
-    for pattern in date_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["incidentInformation"]["date"] = match.group(1).strip()
-            break
-    
-    # Incident time
-    time_patterns = [
-        r'(?:Incident|Loss|Accident)\s*Time[\s:]+(\d{1,2}:\d{2}(?:\s*[AP]M)?)',
-        r'Time[\s:]+(\d{1,2}:\d{2}(?:\s*[AP]M)?)',
-    ]
-    for pattern in time_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["incidentInformation"]["time"] = match.group(1).strip()
-            break
-    
-    # Location
-    location_patterns = [
-        r'Location[\s:]+([^\n]+)',
-        r'(?:Incident|Accident)\s*Location[\s:]+([^\n]+)',
-    ]
-    for pattern in location_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["incidentInformation"]["location"] = match.group(1).strip()
-            break
-    
-    # Description (look for description section)
-    desc_patterns = [
-        r'Description[\s:]+([^\n]+(?:\n(?!\w+:)[^\n]+)*)',
-        r'Incident\s*Description[\s:]+([^\n]+(?:\n(?!\w+:)[^\n]+)*)',
-    ]
-    for pattern in desc_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["incidentInformation"]["description"] = match.group(1).strip()
-            break
-    
-    # Claimant
-    claimant_patterns = [
-        r'Claimant[\s:]+([A-Za-z\s]+?)(?:\n|,)',
-    ]
-    for pattern in claimant_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["involvedParties"]["claimant"] = match.group(1).strip()
-            break
-    
-    # Contact details
-    contact_patterns = [
-        r'Contact[\s:]+([^\n]+)',
-        r'Phone[\s:]+([^\n]+)',
-        r'Email[\s:]+([^\n]+)',
-    ]
-    for pattern in contact_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["involvedParties"]["contactDetails"] = match.group(1).strip()
-            break
-    
-    # Estimated damage (look for currency amounts)
-    damage_patterns = [
-        r'Estimated\s*Damage[\s:]+\$?([\d,]+(?:\.\d{2})?)',
-        r'Damage[\s:]+\$?([\d,]+(?:\.\d{2})?)',
-        r'Loss\s*Amount[\s:]+\$?([\d,]+(?:\.\d{2})?)',
-    ]
-    for pattern in damage_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            amount_str = match.group(1).replace(',', '')
-            try:
-                extracted["assetDetails"]["estimatedDamage"] = float(amount_str)
-            except ValueError:
-                pass
-            break
-    
-    # Claim type
-    claim_type_patterns = [
-        r'Claim\s*Type[\s:]+([A-Za-z]+)',
-        r'Type\s*of\s*Claim[\s:]+([A-Za-z]+)',
-    ]
-    for pattern in claim_type_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["claimType"] = match.group(1).strip().lower()
-            break
-    
-    # Asset type
-    asset_patterns = [
-        r'Asset\s*Type[\s:]+([^\n]+)',
-        r'Vehicle\s*Type[\s:]+([^\n]+)',
-    ]
-    for pattern in asset_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["assetDetails"]["assetType"] = match.group(1).strip()
-            break
-    
-    # Asset ID (VIN, license plate, etc.)
-    asset_id_patterns = [
-        r'(?:VIN|Vehicle\s*ID)[\s:]+([A-Z0-9]+)',
-        r'License\s*Plate[\s:]+([A-Z0-9-]+)',
-        r'Asset\s*ID[\s:]+([A-Z0-9-]+)',
-    ]
-    for pattern in asset_id_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            extracted["assetDetails"]["assetId"] = match.group(1).strip()
-            break
+    Sentences that merely contain a colon ("arrived at 10:30 PM",
+    "Witness stated: ...") are not labels and stay part of a description.
+    """
+    key, sep, _ = line.partition(':')
+    if not sep:
+        return False
+    key = ' '.join(key.split())
+    return key.lower() in LINE_LABELS or _SINGLE_WORD_KEY.fullmatch(key) is not None
+
+
+def _scan_labeled_lines(text: str) -> dict:
+    """Resolve fields from "Key: value" lines in a single pass over the text.
+    
+    Args:
+        text: Raw FNOL document text
+        
+    Returns:
+        Mapping of field path to extracted value for every field found
+    """
+    found = {}
+    lines = text.splitlines()
+    
+    for index, line in enumerate(lines):
+        key, sep, value = line.partition(':')
+        if not sep:
+            continue
+        
+        label = LINE_LABELS.get(' '.join(key.split()).lower())
+        if label is None:
+            continue
+        
+        field_path, rank = label
+        if field_path in found and found[field_path][0] <= rank:
+            continue
+        
+        match = LINE_VALUE_PATTERNS[field_path].match(value.strip())
+        if not match:
+            continue
+        
+        raw_value = match.group(1)
+        if field_path == "incidentInformation.description":
+            # Description may continue on following lines until a blank
+            # line or the next labeled entry
+            continuation = []
+            for next_line in lines[index + 1:]:
+                if not next_line.strip() or _is_label_line(next_line):
+                    break
+                continuation.append(next_line)
+            if continuation:
+                raw_value = '\n'.join([raw_value, *continuation])
+        
+        converted = FIELD_RULES[field_path][1](raw_value)
+        if converted is not None:
+            found[field_path] = (rank, converted)
+    
+    return {field_path: value for field_path, (_, value) in found.items()}
+
+
+def extract_fields_heuristic(text: str) -> dict:
+    """Fallback regex/keyword-based extraction.
+    
+    This is a simple heuristic approach that looks for common patterns
+    in FNOL documents. Less accurate than LLM extraction but provides
+    graceful degradation.
+    
+    Labeled "Key: value" lines are resolved in one pass over the text;
+    only fields still missing afterwards are searched for with the
+    full-text pattern cascade.
+    
+    Args:
+        text: Raw FNOL document text
+        
+    Returns:
+        Dictionary containing extracted fields (many may be null)
+    """
+    extracted = _empty_extraction()
+    labeled = _scan_labeled_lines(text)
+    # For ASCII, lower() keeps every offset and agrees with re.IGNORECASE,
+    # so matches on the lowered copy map straight back onto the original;
+    # other text uses the case-insensitive patterns directly
+    lowered = text.lower() if text.isascii() else None
+    
+    for field_path, (patterns, convert) in FIELD_RULES.items():
+        value = labeled.get(field_path)
+        
+        if value is None:
+            for pattern in patterns:
+                if lowered is not None:
+                    match = _LOWER_PATTERNS[pattern].search(lowered)
+                    if match:
+                        value = convert(text[match.start(1):match.end(1)])
+                        break
+                else:
+                    match = pattern.search(text)
+                    if match:
+                        value = convert(match.group(1))
+                        break
+        
+        section, _, field = field_path.rpartition('.')
+        target = extracted[section] if section else extracted
+        target[field] = value
     
     return extracted
 
 
+def _has_value(value) -> bool:
+    """Return True if an extracted value counts as present."""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return bool(value.strip())
+    if isinstance(value, list):
+        return bool(value)
+    return True
+
+
+def _missing_mandatory(extracted: dict) -> bool:
+    """Check whether any mandatory field is absent from an extraction dict.
+    
+    Args:
+        extracted: Extraction dictionary in the defined schema
+        
+    Returns:
+        True if at least one mandatory field is null or blank
+    """
+    for path in MANDATORY_FIELDS_PARSED:
+        value = extracted
+        for part in path:
+            value = value.get(part) if isinstance(value, dict) else None
+        if not _has_value(value):
+            return True
+    return False
+
+
+def _merge(heuristic: dict, gemini: dict) -> dict:
+    """Fill the gaps in a heuristic extraction with Gemini's values.
+    
+    Heuristic values come from known document patterns and are trusted
+    over Gemini's; Gemini only supplies fields the heuristic left null.
+    
+    Args:
+        heuristic: Result of extract_fields_heuristic
+        gemini: Result of a Gemini extraction
+        
+    Returns:
+        Merged extraction dictionary
+    """
+    merged = copy.deepcopy(heuristic)
+    for key, value in gemini.items():
+        if key not in merged:
+            continue
+        if isinstance(merged[key], dict):
+            if not isinstance(value, dict):
+                continue
+            for sub_key, sub_value in value.items():
+                if sub_key in merged[key] and not _has_value(merged[key][sub_key]):
+                    merged[key][sub_key] = sub_value
+        elif not _has_value(merged[key]):
+            merged[key] = value
+    return merged
+
+
 def extract_fields(text: str) -> dict:
     """Main extraction function with fallback logic.
     
-    Attempts to extract fields using Gemini API first, then falls back
-    to heuristic extraction if Gemini is unavailable or fails.
+    Runs the deterministic heuristic extractor first and only calls Gemini
+    when a mandatory field is still missing. Gemini's values fill the
+    heuristic's gaps but never override what the heuristic found.
     
     Args:
         text: Raw FNOL document text
@@ -331,15 +741,23 @@ def extract_fields(text: str) -> dict:
     Raises:
         ExtractionError: If both Gemini and heuristic extraction fail
     """
-    # Try Gemini first
+    heuristic = None
+    heuristic_error = None
     try:
-        return extract_fields_with_gemini(text)
-    except GeminiAPIError:
-        # Fall back to heuristic extraction
-        pass
+        heuristic = extract_fields_heuristic(text)
+    except Exception as e:
+        heuristic_error = e
+    
+    if heuristic is not None and not _missing_mandatory(heuristic):
+        return heuristic
     
-    # Use heuristic fallback
     try:
-        return extract_fields_heuristic(text)
-    except Exception as e:
-        raise ExtractionError(f"All extraction methods failed: {str(e)}")
+        gemini = extract_fields_with_gemini(text)
+    except GeminiAPIError as e:
+        if heuristic is None:
+            raise ExtractionError(f"All extraction methods failed: {str(heuristic_error or e)}")
+        return heuristic
+    
+    if heuristic is None:
+        return gemini
+    return _merge(heuristic, gemini)
@@ -6,22 +6,23 @@ documents. It orchestrates the complete processing pipeline: parsing, extraction
 validation, and routing.
 """
 
-import tempfile
-import os
+import asyncio
 from pathlib import Path
 from typing import Optional
 from fastapi import FastAPI, File, UploadFile, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from app.models import ProcessClaimResponse, ErrorResponse, ExtractedFields
 from app.parser import (
-    parse_document,
+    parse_pdf_bytes,
+    parse_txt_bytes,
     EmptyDocumentError,
     CorruptedFileError,
     ParserError
 )
-from app.extractor import extract_fields, ExtractionError
+from app.extractor import extract_fields, extract_fields_batch, ExtractionError
 from app.router_rules import identify_missing_fields, determine_route
 
 
@@ -29,7 +30,9 @@ from app.router_rules import identify_missing_fields, determine_route
 app = FastAPI(
     title="FNOL Claim Processor",
     description="Automated processing of First Notice of Loss insurance claims",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the nested response models faster than json.dumps
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for cross-origin requests
@@ -51,6 +54,53 @@ class TextClaimRequest(BaseModel):
 # Maximum file size: 10MB
 MAX_FILE_SIZE = 10 * 1024 * 1024
 
+# Upload read size when buffering uploads into memory: 64KB
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Maximum number of documents per batch request
+MAX_BATCH_SIZE = 50
+
+
+def _file_too_large() -> HTTPException:
+    """Build the 413 error for uploads over MAX_FILE_SIZE."""
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail={
+            "error": "FileTooLarge",
+            "message": f"File size exceeds maximum limit of {MAX_FILE_SIZE / (1024*1024)}MB."
+        }
+    )
+
+
+async def _read_upload_chunks(file: UploadFile):
+    """Yield an upload in chunks, raising 413 once MAX_FILE_SIZE is exceeded."""
+    total_size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total_size += len(chunk)
+        if total_size > MAX_FILE_SIZE:
+            raise _file_too_large()
+        yield chunk
+
+
+def _build_claim_response(extracted_fields: ExtractedFields) -> ProcessClaimResponse:
+    """Validate completeness, route the claim and build the API response."""
+    # Identify missing mandatory fields
+    # Requirements: 6.1, 6.2, 6.3, 6.4
+    missing_fields = identify_missing_fields(extracted_fields)
+    
+    # Determine routing decision
+    # Requirements: 7.1, 7.2, 7.3, 7.4, 7.5, 7.6, 8.1, 8.2, 8.3, 8.4, 8.5, 8.6
+    recommended_route, reasoning = determine_route(extracted_fields, missing_fields)
+    
+    # Build and return response
+    # Requirements: 9.1, 9.2, 9.3, 9.4
+    return ProcessClaimResponse(
+        extractedFields=extracted_fields,
+        missingFields=missing_fields,
+        recommendedRoute=recommended_route,
+        reasoning=reasoning
+    )
+
 
 @app.get("/")
 async def root():
@@ -96,7 +146,6 @@ async def process_claim(
     """
     
     raw_text = None
-    temp_file_path = None
     
     try:
         # Validate input: must provide either file or text
@@ -123,32 +172,24 @@ async def process_claim(
                     }
                 )
             
-            # Read file content
-            file_content = await file.read()
-            
-            # Check file size
-            if len(file_content) > MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail={
-                        "error": "FileTooLarge",
-                        "message": f"File size exceeds maximum limit of {MAX_FILE_SIZE / (1024*1024)}MB."
-                    }
-                )
+            # Reject early when the declared size is already over the limit
+            if file.size is not None and file.size > MAX_FILE_SIZE:
+                raise _file_too_large()
             
-            # Save to temporary file for parsing
-            with tempfile.NamedTemporaryFile(
-                mode='wb',
-                suffix=f'.{file_extension}',
-                delete=False
-            ) as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
+            # Uploads are capped at MAX_FILE_SIZE, so both formats are
+            # parsed from memory with no temporary file
+            file_content = bytearray()
+            async for chunk in _read_upload_chunks(file):
+                file_content.extend(chunk)
             
             # Parse document to extract raw text
             # Requirements: 3.1, 3.2, 3.3, 4.1, 4.2, 4.3
             try:
-                raw_text = parse_document(temp_file_path, file_extension)
+                # Parsing is blocking work; run it off the event loop
+                if file_extension == 'txt':
+                    raw_text = await asyncio.to_thread(parse_txt_bytes, file_content)
+                else:
+                    raw_text = await asyncio.to_thread(parse_pdf_bytes, file_content)
             except EmptyDocumentError as e:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -192,10 +233,11 @@ async def process_claim(
         # Extract structured fields from raw text
         # Requirements: 2.1-2.16, 5.1, 5.2, 5.3, 5.4, 5.5
         try:
-            extracted_dict = extract_fields(raw_text)
+            # Gemini call or regex fallback both block; run off the event loop
+            extracted_dict = await asyncio.to_thread(extract_fields, raw_text)
             
             # Convert to Pydantic model for validation
-            extracted_fields = ExtractedFields(**extracted_dict)
+            extracted_fields = ExtractedFields.model_validate(extracted_dict)
             
         except ExtractionError as e:
             raise HTTPException(
@@ -216,24 +258,7 @@ async def process_claim(
                 }
             )
         
-        # Identify missing mandatory fields
-        # Requirements: 6.1, 6.2, 6.3, 6.4
-        missing_fields = identify_missing_fields(extracted_fields)
-        
-        # Determine routing decision
-        # Requirements: 7.1, 7.2, 7.3, 7.4, 7.5, 7.6, 8.1, 8.2, 8.3, 8.4, 8.5, 8.6
-        recommended_route, reasoning = determine_route(extracted_fields, missing_fields)
-        
-        # Build and return response
-        # Requirements: 9.1, 9.2, 9.3, 9.4
-        response = ProcessClaimResponse(
-            extractedFields=extracted_fields,
-            missingFields=missing_fields,
-            recommendedRoute=recommended_route,
-            reasoning=reasoning
-        )
-        
-        return response
+        return _build_claim_response(extracted_fields)
     
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -249,14 +274,6 @@ async def process_claim(
                 "details": str(e)
             }
         )
-    
-    finally:
-        # Clean up temporary file
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.unlink(temp_file_path)
-            except Exception:
-                pass  # Ignore cleanup errors
 
 
 # Alternative endpoint for JSON text input
@@ -282,6 +299,80 @@ async def process_claim_text(request: TextClaimRequest):
     return await process_claim(file=None, text=request.text)
 
 
+@app.post(
+    "/process-claims-batch",
+    response_model=list[ProcessClaimResponse],
+    responses={
+        400: {"model": ErrorResponse, "description": "Bad Request - Invalid input"},
+        413: {"model": ErrorResponse, "description": "Payload Too Large"},
+        500: {"model": ErrorResponse, "description": "Internal Server Error"},
+        503: {"model": ErrorResponse, "description": "Service Unavailable"}
+    },
+    summary="Process a batch of FNOL claim texts",
+    description="Accept up to 50 FNOL document texts via JSON and return one structured extraction with routing recommendation per document, in request order"
+)
+async def process_claims_batch(requests: list[TextClaimRequest]):
+    """
+    Process several FNOL claim texts in one call.
+    
+    Documents are extracted concurrently (with a bounded number of Gemini
+    requests in flight) and each is then validated and routed exactly as
+    by /process-claim.
+    """
+    if not requests:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "EmptyBatch",
+                "message": "No claims provided. Please submit at least one FNOL document text."
+            }
+        )
+    
+    if len(requests) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail={
+                "error": "BatchTooLarge",
+                "message": f"Batch size exceeds maximum limit of {MAX_BATCH_SIZE} claims."
+            }
+        )
+    
+    for index, request in enumerate(requests):
+        if not request.text.strip():
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "EmptyText",
+                    "message": f"Claim at index {index} is empty. Please provide valid FNOL document text."
+                }
+            )
+    
+    try:
+        extracted_dicts = await extract_fields_batch([request.text for request in requests])
+        extracted = [ExtractedFields.model_validate(extracted_dict) for extracted_dict in extracted_dicts]
+        
+    except ExtractionError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "error": "ExtractionError",
+                "message": "Field extraction service unavailable",
+                "details": str(e)
+            }
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "ExtractionError",
+                "message": "Failed to extract fields from document",
+                "details": str(e)
+            }
+        )
+    
+    return [_build_claim_response(extracted_fields) for extracted_fields in extracted]
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -7,12 +7,19 @@ All field names use camelCase for consistency.
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Extracted-field models are immutable once built, so the claim that
+# missing fields were computed from is the one that gets routed and returned
+EXTRACTION_MODEL_CONFIG = ConfigDict(frozen=True)
 
 
 class PolicyInformation(BaseModel):
     """Policy-related information extracted from FNOL documents."""
     
+    model_config = EXTRACTION_MODEL_CONFIG
+    
     policyNumber: Optional[str] = Field(
         None,
         description="Unique identifier for the insurance policy"
@@ -30,6 +37,8 @@ class PolicyInformation(BaseModel):
 class IncidentInformation(BaseModel):
     """Incident details extracted from FNOL documents."""
     
+    model_config = EXTRACTION_MODEL_CONFIG
+    
     date: Optional[str] = Field(
         None,
         description="Date when the incident occurred"
@@ -51,6 +60,8 @@ class IncidentInformation(BaseModel):
 class InvolvedParties(BaseModel):
     """Information about parties involved in the claim."""
     
+    model_config = EXTRACTION_MODEL_CONFIG
+    
     claimant: Optional[str] = Field(
         None,
         description="Name of the claimant"
@@ -68,6 +79,8 @@ class InvolvedParties(BaseModel):
 class AssetDetails(BaseModel):
     """Details about the asset involved in the claim."""
     
+    model_config = EXTRACTION_MODEL_CONFIG
+    
     assetType: Optional[str] = Field(
         None,
         description="Type of asset (e.g., vehicle, property)"
@@ -85,6 +98,8 @@ class AssetDetails(BaseModel):
 class ExtractedFields(BaseModel):
     """Complete set of fields extracted from an FNOL document."""
     
+    model_config = EXTRACTION_MODEL_CONFIG
+    
     policyInformation: PolicyInformation = Field(
         ...,
         description="Policy-related information"
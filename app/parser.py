@@ -4,9 +4,10 @@ This module handles parsing of PDF and TXT files to extract raw text content.
 Supports error handling for empty files, corrupted files, and encoding issues.
 """
 
+import io
 import pdfplumber
 from pathlib import Path
-from typing import Union
+from typing import IO, Union
 
 
 class ParserError(Exception):
@@ -24,13 +25,13 @@ class CorruptedFileError(ParserError):
     pass
 
 
-def parse_pdf(file_path: Union[str, Path]) -> str:
+def parse_pdf(file_path: Union[str, Path, IO[bytes]]) -> str:
     """Extract text from a PDF file using pdfplumber.
     
     Processes text-based PDFs (not scanned images requiring OCR).
     
     Args:
-        file_path: Path to the PDF file
+        file_path: Path to the PDF file, or a binary file object
         
     Returns:
         Extracted text content as a string
@@ -44,17 +45,26 @@ def parse_pdf(file_path: Union[str, Path]) -> str:
     """
     try:
         with pdfplumber.open(file_path) as pdf:
-            text_parts = []
+            # Stream page text into one buffer instead of collecting a list
+            # of page strings and joining them at the end
+            buffer = io.StringIO()
+            has_text = False
             
             for page in pdf.pages:
                 page_text = page.extract_text()
+                # Release the page's parsed layout objects once read
+                page.close()
+                
                 if page_text:
-                    text_parts.append(page_text)
+                    if has_text:
+                        buffer.write("\n")
+                    buffer.write(page_text)
+                    has_text = True
             
-            if not text_parts:
+            if not has_text:
                 raise EmptyDocumentError("Document contains no extractable text")
             
-            return "\n".join(text_parts)
+            return buffer.getvalue()
             
     except EmptyDocumentError:
         raise
@@ -101,6 +111,57 @@ def parse_txt(file_path: Union[str, Path]) -> str:
         raise ParserError(error_msg) from e
 
 
+def parse_txt_bytes(content: bytes) -> str:
+    """Decode TXT content that is already in memory (e.g. an upload).
+    
+    Same behaviour as parse_txt without the file round-trip: UTF-8 first,
+    then latin-1, with line endings normalized to "\n".
+    
+    Args:
+        content: Raw bytes of the TXT document
+        
+    Returns:
+        Decoded content as a string
+        
+    Raises:
+        EmptyDocumentError: If the content is empty or whitespace only
+        
+    Requirements: 4.1, 4.2, 4.3
+    """
+    try:
+        text = content.decode('utf-8')
+    except UnicodeDecodeError:
+        text = content.decode('latin-1')
+    
+    # Match the universal-newline translation parse_txt gets from open()
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    if not text.strip():
+        raise EmptyDocumentError("Document contains no content")
+    
+    return text
+
+
+def parse_pdf_bytes(content: bytes) -> str:
+    """Extract text from PDF content that is already in memory (e.g. an upload).
+    
+    Same behaviour as parse_pdf without writing the bytes to disk first.
+    
+    Args:
+        content: Raw bytes of the PDF document
+        
+    Returns:
+        Extracted text content as a string
+        
+    Raises:
+        EmptyDocumentError: If the PDF contains no extractable text
+        CorruptedFileError: If the PDF content is corrupted or cannot be parsed
+        
+    Requirements: 3.1, 3.2, 3.3
+    """
+    return parse_pdf(io.BytesIO(content))
+
+
 def parse_document(file_path: Union[str, Path], file_type: str) -> str:
     """Route to appropriate parser based on file type.
     
@@ -7,10 +7,20 @@ all sample documents and displaying the results.
 """
 
 import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from app.parser import parse_document
 from app.extractor import extract_fields
-from app.router_rules import identify_missing_fields, determine_route
+from app.router_rules import (
+    identify_missing_fields,
+    determine_route,
+    ROUTE_INVESTIGATION,
+    ROUTE_MANUAL_REVIEW,
+    ROUTE_SPECIALIST_QUEUE,
+    ROUTE_FAST_TRACK,
+    ROUTE_STANDARD
+)
 from app.models import ExtractedFields
 
 
@@ -21,15 +31,13 @@ def process_fnol_document(file_path: str) -> dict:
     file_type = Path(file_path).suffix.lstrip('.')
     
     # Step 1: Parse document
-    print(f"  📄 Parsing {Path(file_path).name}...")
     raw_text = parse_document(file_path, file_type)
     
     # Step 2: Extract fields
-    print(f"  🔍 Extracting fields...")
     extracted_dict = extract_fields(raw_text)
     
     # Step 3: Validate with Pydantic
-    extracted = ExtractedFields(**extracted_dict)
+    extracted = ExtractedFields.model_validate(extracted_dict)
     
     # Step 4: Identify missing fields
     missing = identify_missing_fields(extracted)
@@ -38,13 +46,23 @@ def process_fnol_document(file_path: str) -> dict:
     route, reasoning = determine_route(extracted, missing)
     
     return {
-        "extractedFields": extracted.dict(),
+        "extractedFields": extracted,
         "missingFields": missing,
         "recommendedRoute": route,
         "reasoning": reasoning
     }
 
 
+# Emoji shown next to each route, keyed by the router's route constants
+ROUTE_EMOJI = {
+    ROUTE_FAST_TRACK: "🚀",
+    ROUTE_MANUAL_REVIEW: "👤",
+    ROUTE_INVESTIGATION: "🔍",
+    ROUTE_SPECIALIST_QUEUE: "🏥",
+    ROUTE_STANDARD: "📊"
+}
+
+
 def print_result(filename: str, result: dict):
     """Pretty print processing result."""
     print(f"\n{'='*80}")
@@ -53,15 +71,8 @@ def print_result(filename: str, result: dict):
     
     # Route and reasoning
     route = result["recommendedRoute"]
-    route_emoji = {
-        "FastTrack": "🚀",
-        "ManualReview": "👤",
-        "Investigation": "🔍",
-        "SpecialistQueue": "🏥",
-        "Standard": "📊"
-    }
     
-    print(f"\n{route_emoji.get(route, '📌')} Recommended Route: {route}")
+    print(f"\n{ROUTE_EMOJI.get(route, '📌')} Recommended Route: {route}")
     print(f"💭 Reasoning: {result['reasoning']}")
     
     # Missing fields
@@ -72,26 +83,25 @@ def print_result(filename: str, result: dict):
     else:
         print(f"\n✅ All mandatory fields present")
     
-    # Key extracted data
+    # Key extracted data, read straight off the model
     fields = result["extractedFields"]
     print(f"\n📊 Key Extracted Data:")
     
-    policy_info = fields.get("policyInformation", {})
-    if policy_info.get("policyNumber"):
-        print(f"   Policy: {policy_info['policyNumber']}")
-    if policy_info.get("policyholderName"):
-        print(f"   Policyholder: {policy_info['policyholderName']}")
+    policy_info = fields.policyInformation
+    if policy_info.policyNumber:
+        print(f"   Policy: {policy_info.policyNumber}")
+    if policy_info.policyholderName:
+        print(f"   Policyholder: {policy_info.policyholderName}")
     
-    incident_info = fields.get("incidentInformation", {})
-    if incident_info.get("date"):
-        print(f"   Incident Date: {incident_info['date']}")
+    if fields.incidentInformation.date:
+        print(f"   Incident Date: {fields.incidentInformation.date}")
     
-    if fields.get("claimType"):
-        print(f"   Claim Type: {fields['claimType']}")
+    if fields.claimType:
+        print(f"   Claim Type: {fields.claimType}")
     
-    asset_details = fields.get("assetDetails", {})
-    if asset_details.get("estimatedDamage"):
-        print(f"   Estimated Damage: ${asset_details['estimatedDamage']:,.2f}")
+    estimated_damage = fields.assetDetails.estimatedDamage
+    if estimated_damage:
+        print(f"   Estimated Damage: ${estimated_damage:,.2f}")
 
 
 def main():
@@ -117,33 +127,42 @@ def main():
     
     results = []
     
+    existing_docs = []
     for doc_path in sample_docs:
-        if not Path(doc_path).exists():
+        if Path(doc_path).exists():
+            existing_docs.append(doc_path)
+        else:
             print(f"\n⚠️  Skipping {doc_path} (not found)")
-            continue
+    
+    # Documents are independent, so parse/extract them concurrently (this
+    # overlaps Gemini calls when an API key is set); results are still
+    # printed in the original order
+    with ThreadPoolExecutor(max_workers=max(len(existing_docs), 1)) as executor:
+        futures = [
+            (doc_path, executor.submit(process_fnol_document, doc_path))
+            for doc_path in existing_docs
+        ]
         
-        try:
+        for doc_path, future in futures:
             print(f"\n{'─'*80}")
             print(f"Processing: {Path(doc_path).name}")
             print(f"{'─'*80}")
             
-            result = process_fnol_document(doc_path)
-            results.append((Path(doc_path).name, result))
-            
-            print_result(Path(doc_path).name, result)
-            
-        except Exception as e:
-            print(f"\n❌ Error processing {doc_path}: {str(e)}")
+            try:
+                result = future.result()
+                results.append((Path(doc_path).name, result))
+                
+                print_result(Path(doc_path).name, result)
+                
+            except Exception as e:
+                print(f"\n❌ Error processing {doc_path}: {str(e)}")
     
     # Summary
     print(f"\n\n{'='*80}")
     print("📊 Processing Summary")
     print(f"{'='*80}")
     
-    route_counts = {}
-    for filename, result in results:
-        route = result["recommendedRoute"]
-        route_counts[route] = route_counts.get(route, 0) + 1
+    route_counts = Counter(result["recommendedRoute"] for _, result in results)
     
     print(f"\nTotal documents processed: {len(results)}")
     print(f"\nRouting Distribution:")
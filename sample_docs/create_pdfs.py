@@ -10,38 +10,43 @@ import os
 
 def create_pdf_from_txt(txt_file, pdf_file):
     """Convert a text file to PDF with proper formatting."""
-    # Read the text file
-    with open(txt_file, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
-    
     # Create PDF
     c = canvas.Canvas(pdf_file, pagesize=letter)
     width, height = letter
     
     # Set up text formatting
-    y_position = height - inch
+    top = height - inch
     line_height = 14
     left_margin = inch
     
-    c.setFont("Helvetica", 10)
+    # One text object per page, so lines are emitted in a single text block
+    # (setFont resets leading to 1.2 * size unless it is passed explicitly)
+    text = c.beginText(left_margin, top)
+    current_font = None
     
-    for line in lines:
-        # Check if we need a new page
-        if y_position < inch:
-            c.showPage()
-            c.setFont("Helvetica", 10)
-            y_position = height - inch
-        
-        # Handle bold headers (lines ending with colon)
-        if line.strip().endswith(':') and not line.strip().startswith(' '):
-            c.setFont("Helvetica-Bold", 10)
-            c.drawString(left_margin, y_position, line.strip())
-            c.setFont("Helvetica", 10)
-        else:
-            c.drawString(left_margin, y_position, line.rstrip())
-        
-        y_position -= line_height
+    # Stream the text file line by line rather than reading it all first
+    with open(txt_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            # Check if we need a new page
+            if text.getY() < inch:
+                c.drawText(text)
+                c.showPage()
+                text = c.beginText(left_margin, top)
+                current_font = None
+            
+            # Handle bold headers (lines ending with colon)
+            stripped = line.strip()
+            is_header = stripped.endswith(':') and not stripped.startswith(' ')
+            
+            # Only emit a font change when the font actually differs
+            font = "Helvetica-Bold" if is_header else "Helvetica"
+            if font != current_font:
+                text.setFont(font, 10, line_height)
+                current_font = font
+            
+            text.textLine(stripped if is_header else line.rstrip())
     
+    c.drawText(text)
     c.save()
     print(f"Created: {pdf_file}")
 
@@ -0,0 +1,28 @@
+"""
+Shared Hypothesis configuration for the property-based tests.
+
+Profiles (select with HYPOTHESIS_PROFILE, default "fast"):
+- fast: reproducible green runs for CI and pytest-xdist workers. Examples
+  are derandomized, the example database is disabled so workers do not
+  contend for .hypothesis/, and only explicit and generated examples run
+  (no reuse, shrink or explain phases).
+- dev: same example budget with shrinking and explanations enabled, for
+  debugging a failure locally.
+"""
+
+import os
+
+from hypothesis import Phase, settings
+
+
+settings.register_profile(
+    "fast",
+    max_examples=10,
+    deadline=None,
+    derandomize=True,
+    database=None,
+    phases=(Phase.explicit, Phase.generate),
+)
+settings.register_profile("dev", max_examples=10, deadline=None)
+
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "fast"))
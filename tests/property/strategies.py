@@ -22,7 +22,73 @@ from app.models import (
     AssetDetails,
     ExtractedFields
 )
-from app.router_rules import MANDATORY_FIELDS, FRAUD_KEYWORDS, FAST_TRACK_THRESHOLD
+from app.router_rules import MANDATORY_FIELDS, MANDATORY_FIELDS_PARSED, FRAUD_KEYWORDS, FAST_TRACK_THRESHOLD
+
+
+# ============================================================================
+# Sample Data
+# ============================================================================
+# Value pools and their sampled_from strategies are built once at import
+# rather than on every draw.
+
+_POLICY_PREFIXES = ("POL", "INS", "CLM", "P")
+_FIRST_NAMES = ("John", "Jane", "Michael", "Sarah", "David", "Emily", "Robert", "Lisa")
+_LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_STREETS = ("Main St", "Oak Ave", "Elm St", "Park Blvd", "Washington St", "Maple Dr")
+_CITIES = ("Springfield", "Portland", "Austin", "Denver", "Seattle", "Boston")
+_STATES = ("CA", "TX", "NY", "FL", "IL", "WA", "CO", "MA")
+_ASSET_ID_PREFIXES = ("VIN", "SN", "ID", "REG")
+_ASSET_TYPES = ("vehicle", "property", "equipment")
+_CLAIM_TYPES = (
+    "injury",
+    "property",
+    "liability",
+    "collision",
+    "comprehensive",
+    "theft",
+    "vandalism"
+)
+
+_TEMPLATES_CLEAN = (
+    "Vehicle collision at intersection. Driver failed to yield at stop sign.",
+    "Property damage due to severe weather conditions. Roof sustained water damage.",
+    "Minor fender bender in parking lot. No injuries reported.",
+    "Rear-end collision on highway during rush hour traffic.",
+    "Tree fell on vehicle during storm. Windshield and hood damaged.",
+    "Slip and fall incident on wet floor. Medical attention required.",
+    "Vehicle struck by falling debris from construction site.",
+    "Water damage from burst pipe in basement. Multiple rooms affected."
+)
+_CLEAN_ADDITIONS = (
+    " Police report filed.",
+    " Witnesses present at scene.",
+    " Photos taken of damage.",
+    " Emergency services contacted.",
+    ""
+)
+# Filled in with a fraud keyword
+_TEMPLATES_FRAUD = (
+    "Witness reports suggest {} activity at the scene.",
+    "Details appear {} based on initial investigation.",
+    "Possible {} accident involving multiple parties.",
+    "Evidence indicates this may be a {} claim.",
+    "The circumstances seem {} and require further review."
+)
+
+_POLICY_PREFIXES_ST = st.sampled_from(_POLICY_PREFIXES)
+_FIRST_NAMES_ST = st.sampled_from(_FIRST_NAMES)
+_LAST_NAMES_ST = st.sampled_from(_LAST_NAMES)
+_STREETS_ST = st.sampled_from(_STREETS)
+_CITIES_ST = st.sampled_from(_CITIES)
+_STATES_ST = st.sampled_from(_STATES)
+_ASSET_ID_PREFIXES_ST = st.sampled_from(_ASSET_ID_PREFIXES)
+_ASSET_TYPES_ST = st.sampled_from(_ASSET_TYPES)
+_CLAIM_TYPES_ST = st.sampled_from(_CLAIM_TYPES)
+_TEMPLATES_CLEAN_ST = st.sampled_from(_TEMPLATES_CLEAN)
+_CLEAN_ADDITIONS_ST = st.sampled_from(_CLEAN_ADDITIONS)
+_TEMPLATES_FRAUD_ST = st.sampled_from(_TEMPLATES_FRAUD)
+_FRAUD_KEYWORDS_ST = st.sampled_from(FRAUD_KEYWORDS)
 
 
 # ============================================================================
@@ -32,7 +98,7 @@ from app.router_rules import MANDATORY_FIELDS, FRAUD_KEYWORDS, FAST_TRACK_THRESH
 @st.composite
 def policy_numbers(draw) -> str:
     """Generate realistic policy numbers."""
-    prefix = draw(st.sampled_from(["POL", "INS", "CLM", "P"]))
+    prefix = draw(_POLICY_PREFIXES_ST)
     number = draw(st.integers(min_value=100000, max_value=999999))
     return f"{prefix}-{number}"
 
@@ -40,10 +106,8 @@ def policy_numbers(draw) -> str:
 @st.composite
 def person_names(draw) -> str:
     """Generate realistic person names."""
-    first_names = ["John", "Jane", "Michael", "Sarah", "David", "Emily", "Robert", "Lisa"]
-    last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis"]
-    first = draw(st.sampled_from(first_names))
-    last = draw(st.sampled_from(last_names))
+    first = draw(_FIRST_NAMES_ST)
+    last = draw(_LAST_NAMES_ST)
     return f"{first} {last}"
 
 
@@ -60,8 +124,7 @@ def dates(draw) -> str:
     elif format_choice == 1:
         return f"{year}-{month:02d}-{day:02d}"
     else:
-        months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-        return f"{months[month-1]} {day}, {year}"
+        return f"{_MONTHS[month-1]} {day}, {year}"
 
 
 @st.composite
@@ -86,14 +149,10 @@ def times(draw) -> str:
 @st.composite
 def locations(draw) -> str:
     """Generate realistic location strings."""
-    streets = ["Main St", "Oak Ave", "Elm St", "Park Blvd", "Washington St", "Maple Dr"]
-    cities = ["Springfield", "Portland", "Austin", "Denver", "Seattle", "Boston"]
-    states = ["CA", "TX", "NY", "FL", "IL", "WA", "CO", "MA"]
-    
     street_num = draw(st.integers(min_value=100, max_value=9999))
-    street = draw(st.sampled_from(streets))
-    city = draw(st.sampled_from(cities))
-    state = draw(st.sampled_from(states))
+    street = draw(_STREETS_ST)
+    city = draw(_CITIES_ST)
+    state = draw(_STATES_ST)
     
     return f"{street_num} {street}, {city}, {state}"
 
@@ -110,7 +169,7 @@ def phone_numbers(draw) -> str:
 @st.composite
 def asset_ids(draw) -> str:
     """Generate realistic asset IDs (e.g., VIN, serial numbers)."""
-    prefix = draw(st.sampled_from(["VIN", "SN", "ID", "REG"]))
+    prefix = draw(_ASSET_ID_PREFIXES_ST)
     number = draw(st.text(alphabet=st.characters(whitelist_categories=("Lu", "Nd")), min_size=8, max_size=12))
     return f"{prefix}{number}"
 
@@ -125,15 +184,7 @@ def claim_types() -> SearchStrategy[str]:
     
     Includes "injury" as a special case for routing logic, plus other common types.
     """
-    return st.sampled_from([
-        "injury",
-        "property",
-        "liability",
-        "collision",
-        "comprehensive",
-        "theft",
-        "vandalism"
-    ])
+    return _CLAIM_TYPES_ST
 
 
 # ============================================================================
@@ -182,28 +233,10 @@ def descriptions_without_fraud(draw) -> str:
     
     Used for testing non-investigation routing paths.
     """
-    templates = [
-        "Vehicle collision at intersection. Driver failed to yield at stop sign.",
-        "Property damage due to severe weather conditions. Roof sustained water damage.",
-        "Minor fender bender in parking lot. No injuries reported.",
-        "Rear-end collision on highway during rush hour traffic.",
-        "Tree fell on vehicle during storm. Windshield and hood damaged.",
-        "Slip and fall incident on wet floor. Medical attention required.",
-        "Vehicle struck by falling debris from construction site.",
-        "Water damage from burst pipe in basement. Multiple rooms affected."
-    ]
-    
-    base = draw(st.sampled_from(templates))
+    base = draw(_TEMPLATES_CLEAN_ST)
     
     # Add some variation
-    additions = [
-        " Police report filed.",
-        " Witnesses present at scene.",
-        " Photos taken of damage.",
-        " Emergency services contacted.",
-        ""
-    ]
-    addition = draw(st.sampled_from(additions))
+    addition = draw(_CLEAN_ADDITIONS_ST)
     
     return base + addition
 
@@ -217,22 +250,14 @@ def descriptions_with_fraud(draw) -> str:
     in various cases to test case-insensitive matching.
     """
     # Choose a fraud keyword and vary its case
-    keyword = draw(st.sampled_from(FRAUD_KEYWORDS))
+    keyword = draw(_FRAUD_KEYWORDS_ST)
     case_variant = draw(st.sampled_from([
         keyword.lower(),
         keyword.upper(),
         keyword.capitalize()
     ]))
     
-    templates = [
-        f"Witness reports suggest {case_variant} activity at the scene.",
-        f"Details appear {case_variant} based on initial investigation.",
-        f"Possible {case_variant} accident involving multiple parties.",
-        f"Evidence indicates this may be a {case_variant} claim.",
-        f"The circumstances seem {case_variant} and require further review."
-    ]
-    
-    return draw(st.sampled_from(templates))
+    return draw(_TEMPLATES_FRAUD_ST).format(case_variant)
 
 
 def descriptions(include_fraud: Optional[bool] = None) -> SearchStrategy[str]:
@@ -256,32 +281,26 @@ def descriptions(include_fraud: Optional[bool] = None) -> SearchStrategy[str]:
 # Extracted Fields Strategies
 # ============================================================================
 
-@st.composite
-def policy_information_dicts(draw, allow_missing: bool = False) -> dict:
+def _optional(strategy: SearchStrategy, allow_missing: bool) -> SearchStrategy:
+    """Allow None alongside strategy's values when allow_missing is set."""
+    return st.one_of(st.none(), strategy) if allow_missing else strategy
+
+
+def policy_information_dicts(allow_missing: bool = False) -> SearchStrategy[dict]:
     """
     Generate PolicyInformation as dictionary.
     
     Args:
         allow_missing: If True, fields may be None
     """
-    if allow_missing:
-        policy_num = draw(st.one_of(st.none(), policy_numbers()))
-        holder_name = draw(st.one_of(st.none(), person_names()))
-        effective = draw(st.one_of(st.none(), st.text(min_size=10, max_size=50)))
-    else:
-        policy_num = draw(policy_numbers())
-        holder_name = draw(person_names())
-        effective = draw(st.text(min_size=10, max_size=50))
-    
-    return {
-        "policyNumber": policy_num,
-        "policyholderName": holder_name,
-        "effectiveDates": effective
-    }
+    return st.fixed_dictionaries({
+        "policyNumber": _optional(policy_numbers(), allow_missing),
+        "policyholderName": _optional(person_names(), allow_missing),
+        "effectiveDates": _optional(st.text(min_size=10, max_size=50), allow_missing)
+    })
 
 
-@st.composite
-def incident_information_dicts(draw, allow_missing: bool = False, include_fraud: Optional[bool] = None) -> dict:
+def incident_information_dicts(allow_missing: bool = False, include_fraud: Optional[bool] = None) -> SearchStrategy[dict]:
     """
     Generate IncidentInformation as dictionary.
     
@@ -289,46 +308,24 @@ def incident_information_dicts(draw, allow_missing: bool = False, include_fraud:
         allow_missing: If True, fields may be None
         include_fraud: Control fraud keyword presence in description
     """
-    if allow_missing:
-        date_val = draw(st.one_of(st.none(), dates()))
-        time_val = draw(st.one_of(st.none(), times()))
-        location_val = draw(st.one_of(st.none(), locations()))
-        desc_val = draw(st.one_of(st.none(), descriptions(include_fraud)))
-    else:
-        date_val = draw(dates())
-        time_val = draw(times())
-        location_val = draw(locations())
-        desc_val = draw(descriptions(include_fraud))
-    
-    return {
-        "date": date_val,
-        "time": time_val,
-        "location": location_val,
-        "description": desc_val
-    }
+    return st.fixed_dictionaries({
+        "date": _optional(dates(), allow_missing),
+        "time": _optional(times(), allow_missing),
+        "location": _optional(locations(), allow_missing),
+        "description": _optional(descriptions(include_fraud), allow_missing)
+    })
 
 
-@st.composite
-def involved_parties_dicts(draw, allow_missing: bool = False) -> dict:
+def involved_parties_dicts(allow_missing: bool = False) -> SearchStrategy[dict]:
     """Generate InvolvedParties as dictionary."""
-    if allow_missing:
-        claimant_val = draw(st.one_of(st.none(), person_names()))
-        third_val = draw(st.one_of(st.none(), st.lists(person_names(), min_size=0, max_size=3)))
-        contact_val = draw(st.one_of(st.none(), phone_numbers()))
-    else:
-        claimant_val = draw(person_names())
-        third_val = draw(st.lists(person_names(), min_size=0, max_size=3))
-        contact_val = draw(phone_numbers())
-    
-    return {
-        "claimant": claimant_val,
-        "thirdParties": third_val,
-        "contactDetails": contact_val
-    }
+    return st.fixed_dictionaries({
+        "claimant": _optional(person_names(), allow_missing),
+        "thirdParties": _optional(st.lists(person_names(), min_size=0, max_size=3), allow_missing),
+        "contactDetails": _optional(phone_numbers(), allow_missing)
+    })
 
 
-@st.composite
-def asset_details_dicts(draw, allow_missing: bool = False, damage_strategy: Optional[SearchStrategy[float]] = None) -> dict:
+def asset_details_dicts(allow_missing: bool = False, damage_strategy: Optional[SearchStrategy[float]] = None) -> SearchStrategy[dict]:
     """
     Generate AssetDetails as dictionary.
     
@@ -339,30 +336,19 @@ def asset_details_dicts(draw, allow_missing: bool = False, damage_strategy: Opti
     if damage_strategy is None:
         damage_strategy = damage_amounts()
     
-    if allow_missing:
-        asset_type_val = draw(st.one_of(st.none(), st.sampled_from(["vehicle", "property", "equipment"])))
-        asset_id_val = draw(st.one_of(st.none(), asset_ids()))
-        damage_val = draw(st.one_of(st.none(), damage_strategy))
-    else:
-        asset_type_val = draw(st.sampled_from(["vehicle", "property", "equipment"]))
-        asset_id_val = draw(asset_ids())
-        damage_val = draw(damage_strategy)
-    
-    return {
-        "assetType": asset_type_val,
-        "assetId": asset_id_val,
-        "estimatedDamage": damage_val
-    }
+    return st.fixed_dictionaries({
+        "assetType": _optional(_ASSET_TYPES_ST, allow_missing),
+        "assetId": _optional(asset_ids(), allow_missing),
+        "estimatedDamage": _optional(damage_strategy, allow_missing)
+    })
 
 
-@st.composite
 def extracted_fields_dicts(
-    draw,
     allow_missing: bool = False,
     include_fraud: Optional[bool] = None,
     damage_strategy: Optional[SearchStrategy[float]] = None,
     claim_type_value: Optional[str] = None
-) -> dict:
+) -> SearchStrategy[dict]:
     """
     Generate complete ExtractedFields as dictionary.
     
@@ -372,30 +358,20 @@ def extracted_fields_dicts(
         damage_strategy: Custom strategy for damage amounts
         claim_type_value: Force specific claim type (e.g., "injury")
     """
-    policy_info = draw(policy_information_dicts(allow_missing=allow_missing))
-    incident_info = draw(incident_information_dicts(allow_missing=allow_missing, include_fraud=include_fraud))
-    parties = draw(involved_parties_dicts(allow_missing=False))  # Not mandatory
-    assets = draw(asset_details_dicts(allow_missing=allow_missing, damage_strategy=damage_strategy))
-    
     if claim_type_value is not None:
-        claim_type_val = claim_type_value
-    elif allow_missing:
-        claim_type_val = draw(st.one_of(st.none(), claim_types()))
+        claim_type_strategy = st.just(claim_type_value)
     else:
-        claim_type_val = draw(claim_types())
-    
-    attachments_val = draw(st.one_of(st.none(), st.lists(st.text(min_size=5, max_size=20), min_size=0, max_size=3)))
-    initial_est_val = draw(st.one_of(st.none(), st.floats(min_value=100.0, max_value=100000.0)))
+        claim_type_strategy = _optional(claim_types(), allow_missing)
     
-    return {
-        "policyInformation": policy_info,
-        "incidentInformation": incident_info,
-        "involvedParties": parties,
-        "assetDetails": assets,
-        "claimType": claim_type_val,
-        "attachments": attachments_val,
-        "initialEstimate": initial_est_val
-    }
+    return st.fixed_dictionaries({
+        "policyInformation": policy_information_dicts(allow_missing=allow_missing),
+        "incidentInformation": incident_information_dicts(allow_missing=allow_missing, include_fraud=include_fraud),
+        "involvedParties": involved_parties_dicts(allow_missing=False),  # Not mandatory
+        "assetDetails": asset_details_dicts(allow_missing=allow_missing, damage_strategy=damage_strategy),
+        "claimType": claim_type_strategy,
+        "attachments": st.one_of(st.none(), st.lists(st.text(min_size=5, max_size=20), min_size=0, max_size=3)),
+        "initialEstimate": st.one_of(st.none(), st.floats(min_value=100.0, max_value=100000.0))
+    })
 
 
 @st.composite
@@ -480,8 +456,30 @@ def injury_claims() -> SearchStrategy[ExtractedFields]:
     )
 
 
-@st.composite
-def fast_track_claims(draw) -> ExtractedFields:
+# One prebuilt claim strategy per non-injury claim type, so drawing a
+# FastTrack/Standard claim does not construct new strategies per example
+_FAST_TRACK_POOL = st.one_of(*(
+    extracted_fields_objects(
+        allow_missing=False,
+        include_fraud=False,
+        damage_strategy=low_damage_amounts(),
+        claim_type_value=claim_type
+    )
+    for claim_type in ("property", "collision", "theft", "vandalism")
+))
+
+_STANDARD_POOL = st.one_of(*(
+    extracted_fields_objects(
+        allow_missing=False,
+        include_fraud=False,
+        damage_strategy=high_damage_amounts(),
+        claim_type_value=claim_type
+    )
+    for claim_type in ("property", "collision", "liability", "comprehensive")
+))
+
+
+def fast_track_claims() -> SearchStrategy[ExtractedFields]:
     """
     Generate claims that should route to FastTrack.
     
@@ -490,17 +488,10 @@ def fast_track_claims(draw) -> ExtractedFields:
     - No fraud keywords
     - Claim type is NOT "injury"
     """
-    non_injury_type = draw(st.sampled_from(["property", "collision", "theft", "vandalism"]))
-    return draw(extracted_fields_objects(
-        allow_missing=False,
-        include_fraud=False,
-        damage_strategy=low_damage_amounts(),
-        claim_type_value=non_injury_type
-    ))
+    return _FAST_TRACK_POOL
 
 
-@st.composite
-def standard_claims(draw) -> ExtractedFields:
+def standard_claims() -> SearchStrategy[ExtractedFields]:
     """
     Generate claims that should route to Standard.
     
@@ -509,19 +500,43 @@ def standard_claims(draw) -> ExtractedFields:
     - Claim type is NOT "injury"
     - Estimated damage >= $25,000
     """
-    non_injury_type = draw(st.sampled_from(["property", "collision", "liability", "comprehensive"]))
-    return draw(extracted_fields_objects(
-        allow_missing=False,
-        include_fraud=False,
-        damage_strategy=high_damage_amounts(),
-        claim_type_value=non_injury_type
-    ))
+    return _STANDARD_POOL
 
 
 # ============================================================================
 # FNOL Document Text Strategies
 # ============================================================================
 
+# Document layout filled in by fnol_text
+_FNOL_TEMPLATE = (
+    "FIRST NOTICE OF LOSS\n"
+    + "=" * 50 + "\n"
+    "\n"
+    "POLICY INFORMATION\n"
+    "Policy Number: {policy_num}\n"
+    "Policyholder Name: {holder_name}\n"
+    "Policy Effective Dates: {effective_dates}\n"
+    "\n"
+    "INCIDENT INFORMATION\n"
+    "Date of Incident: {incident_date}\n"
+    "Time of Incident: {incident_time}\n"
+    "Location: {incident_location}\n"
+    "Description: {incident_desc}\n"
+    "\n"
+    "INVOLVED PARTIES\n"
+    "Claimant: {claimant}\n"
+    "Contact Details: {contact}\n"
+    "\n"
+    "ASSET DETAILS\n"
+    "Asset Type: {asset_type}\n"
+    "Asset ID: {asset_id}\n"
+    "Estimated Damage: ${damage:,.2f}\n"
+    "\n"
+    "CLAIM INFORMATION\n"
+    "Claim Type: {claim_type}\n"
+)
+
+
 @st.composite
 def fnol_text(
     draw,
@@ -538,58 +553,44 @@ def fnol_text(
     Returns:
         Formatted FNOL document text as a string
     """
-    # Generate field values
-    policy_num = draw(policy_numbers())
-    holder_name = draw(person_names())
-    effective_dates = f"{draw(dates())} to {draw(dates())}"
-    incident_date = draw(dates())
-    incident_time = draw(times())
-    incident_location = draw(locations())
-    incident_desc = draw(descriptions(include_fraud))
-    claimant = draw(person_names())
-    contact = draw(phone_numbers())
-    asset_type = draw(st.sampled_from(["vehicle", "property", "equipment"]))
-    asset_id = draw(asset_ids())
-    damage = draw(damage_amounts())
-    claim_type = draw(claim_types())
-    
-    # Build document text
-    lines = [
-        "FIRST NOTICE OF LOSS",
-        "=" * 50,
-        "",
-        "POLICY INFORMATION",
-        f"Policy Number: {policy_num}",
-        f"Policyholder Name: {holder_name}",
-        f"Policy Effective Dates: {effective_dates}",
-        "",
-        "INCIDENT INFORMATION",
-        f"Date of Incident: {incident_date}",
-        f"Time of Incident: {incident_time}",
-        f"Location: {incident_location}",
-        f"Description: {incident_desc}",
-        "",
-        "INVOLVED PARTIES",
-        f"Claimant: {claimant}",
-        f"Contact Details: {contact}",
-        "",
-        "ASSET DETAILS",
-        f"Asset Type: {asset_type}",
-        f"Asset ID: {asset_id}",
-        f"Estimated Damage: ${damage:,.2f}",
-        "",
-        "CLAIM INFORMATION",
-        f"Claim Type: {claim_type}",
-        ""
-    ]
-    
-    return "\n".join(lines)
+    # Generate field values in one draw
+    (
+        policy_num, holder_name, effective_from, effective_to,
+        incident_date, incident_time, incident_location, incident_desc,
+        claimant, contact, asset_type, asset_id, damage, claim_type
+    ) = draw(st.tuples(
+        policy_numbers(), person_names(), dates(), dates(),
+        dates(), times(), locations(), descriptions(include_fraud),
+        person_names(), phone_numbers(), _ASSET_TYPES_ST, asset_ids(),
+        damage_amounts(), claim_types()
+    ))
+    effective_dates = f"{effective_from} to {effective_to}"
+    
+    return _FNOL_TEMPLATE.format_map({
+        "policy_num": policy_num,
+        "holder_name": holder_name,
+        "effective_dates": effective_dates,
+        "incident_date": incident_date,
+        "incident_time": incident_time,
+        "incident_location": incident_location,
+        "incident_desc": incident_desc,
+        "claimant": claimant,
+        "contact": contact,
+        "asset_type": asset_type,
+        "asset_id": asset_id,
+        "damage": damage,
+        "claim_type": claim_type,
+    })
 
 
 # ============================================================================
 # Field Sets with Missing Mandatory Fields
 # ============================================================================
 
+# Base claims that field_sets_with_missing_mandatory nulls fields out of
+_COMPLETE_CLAIM_DICTS = extracted_fields_dicts(allow_missing=False, include_fraud=False)
+
+
 @st.composite
 def field_sets_with_missing_mandatory(draw) -> tuple[ExtractedFields, list[str]]:
     """
@@ -600,30 +601,32 @@ def field_sets_with_missing_mandatory(draw) -> tuple[ExtractedFields, list[str]]
     """
     # Choose which mandatory fields to make missing (at least one)
     num_missing = draw(st.integers(min_value=1, max_value=len(MANDATORY_FIELDS)))
-    missing_fields = draw(st.lists(
-        st.sampled_from(MANDATORY_FIELDS),
+    missing_indexes = draw(st.lists(
+        st.integers(min_value=0, max_value=len(MANDATORY_FIELDS) - 1),
         min_size=num_missing,
         max_size=num_missing,
         unique=True
     ))
+    missing_fields = [MANDATORY_FIELDS[i] for i in missing_indexes]
     
     # Generate base fields
-    fields_dict = draw(extracted_fields_dicts(allow_missing=False, include_fraud=False))
-    
-    # Set chosen fields to None
-    for field_path in missing_fields:
-        parts = field_path.split(".")
-        if len(parts) == 1:
-            fields_dict[parts[0]] = None
-        elif len(parts) == 2:
-            fields_dict[parts[0]][parts[1]] = None
-    
-    # Create ExtractedFields object
-    extracted = ExtractedFields(
-        policyInformation=PolicyInformation(**fields_dict["policyInformation"]),
-        incidentInformation=IncidentInformation(**fields_dict["incidentInformation"]),
-        involvedParties=InvolvedParties(**fields_dict["involvedParties"]),
-        assetDetails=AssetDetails(**fields_dict["assetDetails"]),
+    fields_dict = draw(_COMPLETE_CLAIM_DICTS)
+    
+    # Set chosen fields to None, walking the pre-split paths
+    for i in missing_indexes:
+        *parents, field = MANDATORY_FIELDS_PARSED[i]
+        target = fields_dict
+        for key in parents:
+            target = target[key]
+        target[field] = None
+    
+    # Create ExtractedFields object; every value was drawn from a typed
+    # strategy (or nulled above), so model_construct skips re-validation
+    extracted = ExtractedFields.model_construct(
+        policyInformation=PolicyInformation.model_construct(**fields_dict["policyInformation"]),
+        incidentInformation=IncidentInformation.model_construct(**fields_dict["incidentInformation"]),
+        involvedParties=InvolvedParties.model_construct(**fields_dict["involvedParties"]),
+        assetDetails=AssetDetails.model_construct(**fields_dict["assetDetails"]),
         claimType=fields_dict["claimType"],
         attachments=fields_dict["attachments"],
         initialEstimate=fields_dict["initialEstimate"]
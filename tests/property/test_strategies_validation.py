@@ -5,6 +5,7 @@ These tests verify that the strategies generate valid data that conforms
 to the expected schemas and constraints.
 """
 
+import operator
 import pytest
 from hypothesis import given, settings
 from tests.property.strategies import (
@@ -29,14 +30,19 @@ from tests.property.strategies import (
     field_sets_with_missing_mandatory
 )
 from app.models import ExtractedFields
-from app.router_rules import FRAUD_KEYWORDS, FAST_TRACK_THRESHOLD
+from app.router_rules import FRAUD_KEYWORDS, FAST_TRACK_THRESHOLD, MANDATORY_FIELDS
+
+# Dotted mandatory field name -> getter for that nested attribute
+_MANDATORY_GETTERS = {
+    field_path: operator.attrgetter(field_path)
+    for field_path in MANDATORY_FIELDS
+}
 
 
 class TestBasicStrategies:
     """Test basic building block strategies."""
     
     @given(policy_numbers())
-    @settings(max_examples=10)
     def test_policy_numbers_format(self, policy_num):
         """Policy numbers should be non-empty strings."""
         assert isinstance(policy_num, str)
@@ -44,7 +50,6 @@ class TestBasicStrategies:
         assert "-" in policy_num
     
     @given(person_names())
-    @settings(max_examples=10)
     def test_person_names_format(self, name):
         """Person names should contain first and last name."""
         assert isinstance(name, str)
@@ -53,14 +58,12 @@ class TestBasicStrategies:
         assert len(parts) >= 2
     
     @given(dates())
-    @settings(max_examples=10)
     def test_dates_format(self, date_str):
         """Dates should be non-empty strings."""
         assert isinstance(date_str, str)
         assert len(date_str) > 0
     
     @given(claim_types())
-    @settings(max_examples=10)
     def test_claim_types_valid(self, claim_type):
         """Claim types should be from valid set."""
         assert isinstance(claim_type, str)
@@ -120,7 +123,6 @@ class TestExtractedFieldsStrategies:
     """Test extracted fields strategies."""
     
     @given(extracted_fields_objects(allow_missing=False))
-    @settings(max_examples=10)
     def test_extracted_fields_complete(self, fields):
         """Complete extracted fields should have all mandatory fields."""
         assert isinstance(fields, ExtractedFields)
@@ -132,7 +134,6 @@ class TestExtractedFieldsStrategies:
         assert fields.assetDetails.estimatedDamage is not None
     
     @given(fraud_claims())
-    @settings(max_examples=10)
     def test_fraud_claims_have_keywords(self, fields):
         """Fraud claims should contain fraud keywords in description."""
         assert isinstance(fields, ExtractedFields)
@@ -143,14 +144,12 @@ class TestExtractedFieldsStrategies:
         assert has_keyword
     
     @given(injury_claims())
-    @settings(max_examples=10)
     def test_injury_claims_have_injury_type(self, fields):
         """Injury claims should have claim type 'injury'."""
         assert isinstance(fields, ExtractedFields)
         assert fields.claimType == "injury"
     
     @given(fast_track_claims())
-    @settings(max_examples=10)
     def test_fast_track_claims_low_damage(self, fields):
         """Fast track claims should have damage below threshold."""
         assert isinstance(fields, ExtractedFields)
@@ -159,7 +158,6 @@ class TestExtractedFieldsStrategies:
         assert fields.claimType != "injury"
     
     @given(standard_claims())
-    @settings(max_examples=10)
     def test_standard_claims_high_damage(self, fields):
         """Standard claims should have damage at or above threshold."""
         assert isinstance(fields, ExtractedFields)
@@ -172,7 +170,6 @@ class TestFNOLTextStrategy:
     """Test FNOL text generation strategy."""
     
     @given(fnol_text())
-    @settings(max_examples=10)
     def test_fnol_text_format(self, text):
         """FNOL text should contain key sections."""
         assert isinstance(text, str)
@@ -186,7 +183,6 @@ class TestMissingFieldsStrategy:
     """Test missing fields strategy."""
     
     @given(field_sets_with_missing_mandatory())
-    @settings(max_examples=10)
     def test_missing_fields_has_missing(self, data):
         """Field sets should have at least one missing mandatory field."""
         fields, expected_missing = data
@@ -195,15 +191,9 @@ class TestMissingFieldsStrategy:
         assert len(expected_missing) > 0
         
         # Verify at least one field is actually None
-        has_none = False
-        for field_path in expected_missing:
-            parts = field_path.split(".")
-            if len(parts) == 1:
-                if getattr(fields, parts[0], None) is None:
-                    has_none = True
-            elif len(parts) == 2:
-                parent = getattr(fields, parts[0], None)
-                if parent is None or getattr(parent, parts[1], None) is None:
-                    has_none = True
+        has_none = any(
+            _MANDATORY_GETTERS[field_path](fields) is None
+            for field_path in expected_missing
+        )
         
         assert has_none, "At least one mandatory field should be None"
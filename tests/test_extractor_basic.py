@@ -1,7 +1,58 @@
 """Basic tests for the extractor module."""
 
+import asyncio
+
 import pytest
-from app.extractor import extract_fields_heuristic, extract_fields, GeminiAPIError
+from google.api_core import exceptions as google_exceptions
+
+from app import extractor
+from app.extractor import (
+    extract_fields_heuristic,
+    extract_fields,
+    extract_fields_with_gemini,
+    extract_fields_batch,
+    GeminiAPIError,
+)
+from app.models import ExtractedFields
+from app.router_rules import determine_route, identify_missing_fields, ROUTE_INVESTIGATION
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeModel:
+    """Stand-in for genai.GenerativeModel that counts API calls."""
+    
+    def __init__(self, text='{"claimType": "property"}'):
+        self.text = text
+        self.calls = 0
+        self.failures = 0
+        self.last_kwargs = None
+    
+    def generate_content(self, *args, **kwargs):
+        self.calls += 1
+        self.last_kwargs = kwargs
+        return _FakeResponse(self.text)
+    
+    async def generate_content_async(self, prompt, **kwargs):
+        self.calls += 1
+        if self.failures:
+            self.failures -= 1
+            raise google_exceptions.ResourceExhausted("rate limited")
+        # Echo the document's claim type so results can be matched to inputs
+        claim_type = prompt.rsplit("Claim Type: ", 1)[-1].split()[0]
+        return _FakeResponse(f'{{"claimType": "{claim_type}"}}')
+
+
+@pytest.fixture
+def fake_gemini(monkeypatch):
+    """Route Gemini calls to a fake model with an empty response cache."""
+    model = _FakeModel()
+    monkeypatch.setattr(extractor, "_configure_gemini", lambda: model)
+    monkeypatch.setattr(extractor, "_GEMINI_CACHE", extractor.OrderedDict())
+    return model
 
 
 def test_heuristic_extraction_with_complete_fnol():
@@ -80,15 +131,18 @@ def test_heuristic_extraction_with_empty_text():
     assert result["assetDetails"]["estimatedDamage"] is None
 
 
-def test_extract_fields_falls_back_to_heuristic():
+def test_extract_fields_falls_back_to_heuristic(monkeypatch):
     """Test that extract_fields falls back to heuristic when Gemini unavailable."""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.setattr(extractor, "_GEMINI_CACHE", extractor.OrderedDict())
+    
     fnol_text = """
     Policy Number: TEST123
     Incident Date: 03/01/2024
     Estimated Damage: $1,500
     """
     
-    # This should fall back to heuristic if GEMINI_API_KEY is not set
+    # Without GEMINI_API_KEY this falls back to the heuristic
     result = extract_fields(fnol_text)
     
     # Should have extracted something
@@ -98,27 +152,244 @@ def test_extract_fields_falls_back_to_heuristic():
     assert "incidentInformation" in result
 
 
-def test_heuristic_handles_various_date_formats():
-    """Test heuristic extraction handles different date formats."""
-    test_cases = [
-        ("Incident Date: 12/15/2023", "12/15/2023"),
-        ("Date of Incident: 12-15-2023", "12-15-2023"),
-        ("Loss Date: 01/05/2024", "01/05/2024"),
-    ]
+def test_extract_fields_skips_gemini_when_heuristic_complete(fake_gemini):
+    """Test that Gemini is not called when the heuristic finds every mandatory field."""
+    fnol_text = """
+    Policy Number: POL-1
+    Policyholder: Jane Doe
+    Incident Date: 03/01/2024
+    Description: Rear-ended at a stop light
+    Claim Type: property
+    Estimated Damage: $1,500
+    """
     
-    for text, expected_date in test_cases:
-        result = extract_fields_heuristic(text)
-        assert result["incidentInformation"]["date"] == expected_date
+    result = extract_fields(fnol_text)
+    
+    assert fake_gemini.calls == 0
+    assert result["policyInformation"]["policyNumber"] == "POL-1"
+
 
+def test_extract_fields_fills_gaps_from_gemini(fake_gemini):
+    """Test that Gemini fills missing fields without overriding heuristic values."""
+    fake_gemini.text = (
+        '{"policyInformation": {"policyNumber": "WRONG", "policyholderName": "Jane Doe"},'
+        ' "claimType": "property"}'
+    )
+    
+    result = extract_fields("Policy Number: POL-2\nIncident Date: 03/01/2024")
+    
+    assert fake_gemini.calls == 1
+    assert result["policyInformation"]["policyNumber"] == "POL-2"
+    assert result["policyInformation"]["policyholderName"] == "Jane Doe"
+    assert result["claimType"] == "property"
+    assert result["incidentInformation"]["date"] == "03/01/2024"
 
-def test_heuristic_handles_currency_formats():
+
+@pytest.mark.parametrize("text,expected_date", [
+    ("Incident Date: 12/15/2023", "12/15/2023"),
+    ("Date of Incident: 12-15-2023", "12-15-2023"),
+    ("Loss Date: 01/05/2024", "01/05/2024"),
+])
+def test_heuristic_handles_various_date_formats(text, expected_date):
+    """Test heuristic extraction handles different date formats."""
+    result = extract_fields_heuristic(text)
+    assert result["incidentInformation"]["date"] == expected_date
+
+
+@pytest.mark.parametrize("text,expected_amount", [
+    ("Estimated Damage: $5,000.00", 5000.0),
+    ("Damage: $25000", 25000.0),
+    ("Loss Amount: 1500.50", 1500.5),
+])
+def test_heuristic_handles_currency_formats(text, expected_amount):
     """Test heuristic extraction handles different currency formats."""
-    test_cases = [
-        ("Estimated Damage: $5,000.00", 5000.0),
-        ("Damage: $25000", 25000.0),
-        ("Loss Amount: 1500.50", 1500.5),
-    ]
-    
-    for text, expected_amount in test_cases:
-        result = extract_fields_heuristic(text)
-        assert result["assetDetails"]["estimatedDamage"] == expected_amount
+    result = extract_fields_heuristic(text)
+    assert result["assetDetails"]["estimatedDamage"] == expected_amount
+
+
+def test_heuristic_uses_labeled_lines():
+    """Test that multi-word "Key: value" labels resolve to the right field."""
+    fnol_text = """
+    Policyholder Name: Sarah Johnson
+    Incident Description: Rear bumper scraped while parked.
+    Claimant sustained no injuries.
+    
+    Claimant: Sarah Johnson
+    Contact Details: (555) 123-4567
+    Time of Incident: 14:05
+    Asset ID: VIN 1HGBH41JXMN109186 (2021 Honda Accord)
+    """
+    
+    result = extract_fields_heuristic(fnol_text)
+    
+    assert result["policyInformation"]["policyholderName"] == "Sarah Johnson"
+    assert result["incidentInformation"]["description"] == (
+        "Rear bumper scraped while parked.\n    Claimant sustained no injuries."
+    )
+    assert result["involvedParties"]["claimant"] == "Sarah Johnson"
+    assert result["involvedParties"]["contactDetails"] == "(555) 123-4567"
+    assert result["incidentInformation"]["time"] == "14:05"
+    assert result["assetDetails"]["assetId"] == "1HGBH41JXMN109186"
+
+
+def test_heuristic_description_keeps_lines_with_colons():
+    """Test that sentences containing a colon do not end a multi-line description."""
+    fnol_text = (
+        "Policy Number: POL-2024-7781\n"
+        "Description: Rear bumper damaged in parking lot.\n"
+        "Police arrived at 10:30 PM and noted the scene looked staged.\n"
+        "Witness stated: the driver left before police arrived.\n"
+        "Claim Type: property\n"
+    )
+    
+    result = extract_fields_heuristic(fnol_text)
+    
+    assert result["incidentInformation"]["description"] == (
+        "Rear bumper damaged in parking lot.\n"
+        "Police arrived at 10:30 PM and noted the scene looked staged.\n"
+        "Witness stated: the driver left before police arrived."
+    )
+    assert result["claimType"] == "property"
+    
+    extracted = ExtractedFields.model_validate(result)
+    route, _ = determine_route(extracted, identify_missing_fields(extracted))
+    assert route == ROUTE_INVESTIGATION
+
+
+def test_heuristic_labeled_value_must_fully_parse():
+    """Test that a labeled value that only partly fits falls back to the cascade."""
+    fnol_text = (
+        "LOSS AMOUNT $5,000.00 per adjuster\n"
+        "Loss Amount:14:05\n"
+        "Policy Number:\n"
+        "ABC-123\n"
+    )
+    
+    result = extract_fields_heuristic(fnol_text)
+    
+    assert result["assetDetails"]["estimatedDamage"] == 5000.0
+    assert result["policyInformation"]["policyNumber"] == "ABC-123"
+
+
+def test_gemini_responses_cached_by_content(fake_gemini):
+    """Test that resubmitting the same text reuses the cached extraction."""
+    first = extract_fields_with_gemini("Claim Type: property")
+    second = extract_fields_with_gemini("Claim Type: property")
+    
+    assert fake_gemini.calls == 1
+    assert second == first == {"claimType": "property"}
+    
+    extract_fields_with_gemini("Claim Type: theft")
+    assert fake_gemini.calls == 2
+
+
+def test_gemini_cache_returns_independent_copies(fake_gemini):
+    """Test that mutating a cached result does not change the cache entry."""
+    first = extract_fields_with_gemini("Claim Type: property")
+    first["claimType"] = "mutated"
+    
+    second = extract_fields_with_gemini("Claim Type: property")
+    
+    assert second["claimType"] == "property"
+    assert fake_gemini.calls == 1
+
+
+def test_gemini_requests_json_mode(fake_gemini):
+    """Test that Gemini is asked for schema-constrained JSON output."""
+    extract_fields_with_gemini("Claim Type: property")
+    
+    config = fake_gemini.last_kwargs["generation_config"]
+    assert config.response_mime_type == "application/json"
+    assert config.response_schema == extractor.EXTRACTED_SCHEMA
+
+
+def test_gemini_cache_ignores_whitespace_differences(fake_gemini):
+    """Test that documents differing only in whitespace share a cache entry."""
+    extract_fields_with_gemini("Policy Number: POL-1\nClaim Type: property\n")
+    extract_fields_with_gemini("  Policy Number:  POL-1\r\n\r\nClaim Type: property")
+    
+    assert fake_gemini.calls == 1
+
+
+def test_extract_fields_batch_preserves_order(fake_gemini):
+    """Test that batch extraction returns one result per text, in order."""
+    texts = ["Claim Type: theft", "Claim Type: injury", "Claim Type: theft"]
+    
+    results = asyncio.run(extract_fields_batch(texts))
+    
+    assert [r["claimType"] for r in results] == ["theft", "injury", "theft"]
+
+
+def test_extract_fields_batch_retries_rate_limits(fake_gemini, monkeypatch):
+    """Test that rate-limited Gemini calls are retried with backoff."""
+    monkeypatch.setattr(extractor, "GEMINI_RETRY_BASE_DELAY", 0)
+    fake_gemini.failures = 2
+    
+    results = asyncio.run(extract_fields_batch(["Claim Type: collision"]))
+    
+    assert results[0]["claimType"] == "collision"
+    assert fake_gemini.calls == 3
+
+
+def test_extract_fields_batch_falls_back_to_heuristic(monkeypatch):
+    """Test that batch extraction falls back to heuristic without Gemini."""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.setattr(extractor, "_GEMINI_CACHE", extractor.OrderedDict())
+    
+    results = asyncio.run(extract_fields_batch(["Policy Number: BATCH1"]))
+    
+    assert results[0]["policyInformation"]["policyNumber"] == "BATCH1"
+
+
+def test_heuristic_fallback_prefers_earlier_patterns():
+    """Test that a higher-priority pattern wins even when it matches later."""
+    fnol_text = (
+        "Reported 03/02/2024 by phone. Incident Date 03/01/2024 per claimant.\n"
+        "Policy\n"
+        "Policy No. ABC-123 issued in 2023.\n"
+    )
+    
+    result = extract_fields_heuristic(fnol_text)
+    
+    assert result["incidentInformation"]["date"] == "03/01/2024"
+    assert result["policyInformation"]["policyNumber"] == "ABC-123"
+
+
+def test_heuristic_handles_long_whitespace_runs():
+    """Test that long whitespace runs after a label do not blow up matching."""
+    fnol_text = "Policyholder" + " " * 100_000 + "1\nClaimant" + " \t" * 50_000 + "2"
+    
+    result = extract_fields_heuristic(fnol_text)
+    
+    assert result["policyInformation"]["policyholderName"] is None
+    assert result["involvedParties"]["claimant"] is None
+
+
+def test_heuristic_fallback_matches_labels_in_any_case():
+    """Test that fallback patterns match mid-line labels in ASCII and non-ASCII text."""
+    for fnol_text in (
+        "Reported by phone - DESCRIPTION: window broken\n",
+        "Reported by phone \u2014 Description: Caf\u00e9 window broken\n",
+    ):
+        result = extract_fields_heuristic(fnol_text)
+        
+        assert result["incidentInformation"]["description"].endswith("window broken")
+
+
+def test_gemini_client_created_once_per_api_key(monkeypatch):
+    """Test that the Gemini client is reused until the API key changes."""
+    created = []
+    monkeypatch.setattr(extractor.genai, "configure", lambda **kwargs: None)
+    monkeypatch.setattr(
+        extractor.genai, "GenerativeModel", lambda name: created.append(name) or object()
+    )
+    monkeypatch.setattr(extractor, "_MODEL", None)
+    monkeypatch.setattr(extractor, "_MODEL_API_KEY", None)
+    
+    monkeypatch.setenv("GEMINI_API_KEY", "key-1")
+    assert extractor._configure_gemini() is extractor._configure_gemini()
+    assert len(created) == 1
+    
+    monkeypatch.setenv("GEMINI_API_KEY", "key-2")
+    extractor._configure_gemini()
+    assert len(created) == 2
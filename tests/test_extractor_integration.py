@@ -2,7 +2,7 @@
 
 import pytest
 from app.extractor import extract_fields_heuristic
-from app.models import ExtractedFields, PolicyInformation, IncidentInformation, InvolvedParties, AssetDetails
+from app.models import ExtractedFields
 
 
 def test_extracted_fields_validate_with_pydantic():
@@ -28,22 +28,8 @@ def test_extracted_fields_validate_with_pydantic():
     # Extract fields
     extracted_dict = extract_fields_heuristic(fnol_text)
     
-    # Validate with Pydantic models
-    policy_info = PolicyInformation(**extracted_dict["policyInformation"])
-    incident_info = IncidentInformation(**extracted_dict["incidentInformation"])
-    involved_parties = InvolvedParties(**extracted_dict["involvedParties"])
-    asset_details = AssetDetails(**extracted_dict["assetDetails"])
-    
-    # Create full ExtractedFields model
-    extracted_fields = ExtractedFields(
-        policyInformation=policy_info,
-        incidentInformation=incident_info,
-        involvedParties=involved_parties,
-        assetDetails=asset_details,
-        claimType=extracted_dict["claimType"],
-        attachments=extracted_dict["attachments"],
-        initialEstimate=extracted_dict["initialEstimate"]
-    )
+    # Validate the whole dict the way the API does
+    extracted_fields = ExtractedFields.model_validate(extracted_dict)
     
     # Verify the model was created successfully
     assert extracted_fields.policyInformation.policyNumber == "ABC123456"
@@ -62,15 +48,7 @@ def test_extracted_fields_with_nulls_validate():
     extracted_dict = extract_fields_heuristic(fnol_text)
     
     # Should validate even with many null fields
-    extracted_fields = ExtractedFields(
-        policyInformation=PolicyInformation(**extracted_dict["policyInformation"]),
-        incidentInformation=IncidentInformation(**extracted_dict["incidentInformation"]),
-        involvedParties=InvolvedParties(**extracted_dict["involvedParties"]),
-        assetDetails=AssetDetails(**extracted_dict["assetDetails"]),
-        claimType=extracted_dict["claimType"],
-        attachments=extracted_dict["attachments"],
-        initialEstimate=extracted_dict["initialEstimate"]
-    )
+    extracted_fields = ExtractedFields.model_validate(extracted_dict)
     
     # Verify extracted fields
     assert extracted_fields.policyInformation.policyNumber == "MIN123"
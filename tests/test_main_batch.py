@@ -0,0 +1,93 @@
+"""Tests for the /process-claims-batch endpoint."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import extractor
+from app import main
+from app.extractor import ExtractionError
+
+
+def _claim_text(policy_number: str, damage: str) -> str:
+    """Build a complete FNOL text the heuristic can extract on its own."""
+    return (
+        f"Policy Number: {policy_number}\n"
+        "Policyholder: Jane Doe\n"
+        "Incident Date: 03/01/2024\n"
+        "Description: Rear bumper scraped while parked\n"
+        "Claim Type: property\n"
+        f"Estimated Damage: ${damage}\n"
+    )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client with Gemini disabled and an empty Gemini cache."""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    monkeypatch.setattr(extractor, "_GEMINI_CACHE", extractor.OrderedDict())
+    return TestClient(main.app)
+
+
+def test_batch_returns_responses_in_request_order(client):
+    """Test that each claim is extracted and routed, in request order."""
+    response = client.post("/process-claims-batch", json=[
+        {"text": _claim_text("BATCH-001", "1,500.00")},
+        {"text": _claim_text("BATCH-002", "40,000.00")},
+    ])
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["extractedFields"]["policyInformation"]["policyNumber"] for item in body] == [
+        "BATCH-001",
+        "BATCH-002",
+    ]
+    assert [item["recommendedRoute"] for item in body] == ["FastTrack", "Standard"]
+    assert all(item["missingFields"] == [] for item in body)
+
+
+def test_batch_rejects_empty_list(client):
+    """Test that an empty batch is rejected with 400."""
+    response = client.post("/process-claims-batch", json=[])
+    
+    assert response.status_code == 400
+    assert response.json()["detail"]["error"] == "EmptyBatch"
+
+
+def test_batch_rejects_more_than_max_batch_size(client):
+    """Test that batches over MAX_BATCH_SIZE are rejected with 413."""
+    claims = [{"text": _claim_text(f"POL-{i}", "100.00")} for i in range(main.MAX_BATCH_SIZE + 1)]
+    
+    response = client.post("/process-claims-batch", json=claims)
+    
+    assert response.status_code == 413
+    assert response.json()["detail"]["error"] == "BatchTooLarge"
+
+
+def test_batch_rejects_blank_text_with_its_index(client):
+    """Test that a blank claim text is rejected with 400 naming its index."""
+    response = client.post("/process-claims-batch", json=[
+        {"text": _claim_text("BATCH-001", "1,500.00")},
+        {"text": "   \n\t "},
+    ])
+    
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    assert detail["error"] == "EmptyText"
+    assert "index 1" in detail["message"]
+
+
+def test_batch_maps_extraction_error_to_503(client, monkeypatch):
+    """Test that an ExtractionError from the extractor becomes a 503."""
+    async def failing_batch(texts):
+        raise ExtractionError("All extraction methods failed")
+    
+    monkeypatch.setattr(main, "extract_fields_batch", failing_batch)
+    
+    response = client.post("/process-claims-batch", json=[
+        {"text": _claim_text("BATCH-001", "1,500.00")},
+    ])
+    
+    assert response.status_code == 503
+    detail = response.json()["detail"]
+    assert detail["error"] == "ExtractionError"
+    assert "All extraction methods failed" in detail["details"]
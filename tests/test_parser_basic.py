@@ -2,11 +2,10 @@
 
 import pytest
 from pathlib import Path
-import tempfile
-import os
 from app.parser import (
     parse_pdf,
     parse_txt,
+    parse_txt_bytes,
     parse_document,
     EmptyDocumentError,
     CorruptedFileError,
@@ -14,57 +13,41 @@ from app.parser import (
 )
 
 
-def test_parse_txt_with_valid_content():
+def test_parse_txt_with_valid_content(tmp_path):
     """Test parsing a valid TXT file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        f.write("This is a test FNOL document.\nPolicy Number: 12345")
-        temp_path = f.name
+    txt_path = tmp_path / "fnol.txt"
+    txt_path.write_text("This is a test FNOL document.\nPolicy Number: 12345", encoding='utf-8')
     
-    try:
-        result = parse_txt(temp_path)
-        assert "This is a test FNOL document" in result
-        assert "Policy Number: 12345" in result
-    finally:
-        os.unlink(temp_path)
+    result = parse_txt(txt_path)
+    assert "This is a test FNOL document" in result
+    assert "Policy Number: 12345" in result
 
 
-def test_parse_txt_with_empty_file():
+def test_parse_txt_with_empty_file(tmp_path):
     """Test that empty TXT files raise EmptyDocumentError."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        f.write("")
-        temp_path = f.name
+    txt_path = tmp_path / "empty.txt"
+    txt_path.write_text("", encoding='utf-8')
     
-    try:
-        with pytest.raises(EmptyDocumentError, match="Document contains no content"):
-            parse_txt(temp_path)
-    finally:
-        os.unlink(temp_path)
+    with pytest.raises(EmptyDocumentError, match="Document contains no content"):
+        parse_txt(txt_path)
 
 
-def test_parse_txt_with_whitespace_only():
+def test_parse_txt_with_whitespace_only(tmp_path):
     """Test that whitespace-only files raise EmptyDocumentError."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        f.write("   \n\n  \t  ")
-        temp_path = f.name
+    txt_path = tmp_path / "blank.txt"
+    txt_path.write_text("   \n\n  \t  ", encoding='utf-8')
     
-    try:
-        with pytest.raises(EmptyDocumentError, match="Document contains no content"):
-            parse_txt(temp_path)
-    finally:
-        os.unlink(temp_path)
+    with pytest.raises(EmptyDocumentError, match="Document contains no content"):
+        parse_txt(txt_path)
 
 
-def test_parse_document_routes_to_txt():
+def test_parse_document_routes_to_txt(tmp_path):
     """Test that parse_document correctly routes TXT files."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        f.write("Test content")
-        temp_path = f.name
+    txt_path = tmp_path / "fnol.txt"
+    txt_path.write_text("Test content", encoding='utf-8')
     
-    try:
-        result = parse_document(temp_path, 'txt')
-        assert "Test content" in result
-    finally:
-        os.unlink(temp_path)
+    result = parse_document(str(txt_path), 'txt')
+    assert "Test content" in result
 
 
 def test_parse_document_with_unsupported_type():
@@ -73,19 +56,33 @@ def test_parse_document_with_unsupported_type():
         parse_document("dummy.docx", "docx")
 
 
-def test_parse_document_handles_extension_variations():
+def test_parse_document_handles_extension_variations(tmp_path):
     """Test that file type parsing handles dots and case variations."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False, encoding='utf-8') as f:
-        f.write("Test content")
-        temp_path = f.name
+    txt_path = tmp_path / "fnol.txt"
+    txt_path.write_text("Test content", encoding='utf-8')
     
-    try:
-        # Test with dot prefix
-        result = parse_document(temp_path, '.txt')
-        assert "Test content" in result
-        
-        # Test with uppercase
-        result = parse_document(temp_path, 'TXT')
-        assert "Test content" in result
-    finally:
-        os.unlink(temp_path)
+    # Test with dot prefix
+    result = parse_document(str(txt_path), '.txt')
+    assert "Test content" in result
+    
+    # Test with uppercase
+    result = parse_document(str(txt_path), 'TXT')
+    assert "Test content" in result
+
+
+def test_parse_txt_bytes_decodes_utf8():
+    """Test decoding in-memory TXT content with normalized line endings."""
+    result = parse_txt_bytes("Policy Number: 12345\r\nClaimant: José".encode('utf-8'))
+    assert result == "Policy Number: 12345\nClaimant: José"
+
+
+def test_parse_txt_bytes_falls_back_to_latin1():
+    """Test that non-UTF-8 content is decoded as latin-1."""
+    result = parse_txt_bytes("Claimant: Jos\xe9".encode('latin-1'))
+    assert result == "Claimant: Jos\xe9"
+
+
+def test_parse_txt_bytes_with_whitespace_only():
+    """Test that whitespace-only content raises EmptyDocumentError."""
+    with pytest.raises(EmptyDocumentError, match="Document contains no content"):
+        parse_txt_bytes(b"   \n\n  \t  ")
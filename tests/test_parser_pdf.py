@@ -2,7 +2,7 @@
 
 import pytest
 from pathlib import Path
-from app.parser import parse_pdf, parse_document, EmptyDocumentError, CorruptedFileError
+from app.parser import parse_pdf, parse_pdf_bytes, parse_document, EmptyDocumentError, CorruptedFileError
 
 
 def test_parse_pdf_with_nonexistent_file():
@@ -29,3 +29,27 @@ def test_parse_document_handles_pdf_extension_variations():
     # Test with uppercase
     with pytest.raises(CorruptedFileError):
         parse_document("test.pdf", "PDF")
+
+
+def test_parse_pdf_with_sample_document():
+    """Test that text from every page of a real PDF is extracted."""
+    sample = Path(__file__).parent.parent / "sample_docs" / "fnol_fasttrack.pdf"
+    
+    result = parse_pdf(sample)
+    
+    assert result.startswith("FIRST NOTICE OF LOSS")
+    assert "Policy Number: POL-2024-789456" in result
+    assert not result.endswith("\n")
+
+
+def test_parse_pdf_bytes_matches_parse_pdf():
+    """Test that in-memory PDF content parses the same as the file on disk."""
+    sample = Path(__file__).parent.parent / "sample_docs" / "fnol_fasttrack.pdf"
+    
+    assert parse_pdf_bytes(sample.read_bytes()) == parse_pdf(sample)
+
+
+def test_parse_pdf_bytes_with_invalid_content():
+    """Test that non-PDF bytes raise CorruptedFileError."""
+    with pytest.raises(CorruptedFileError):
+        parse_pdf_bytes(b"not a pdf")
@@ -17,7 +17,10 @@ from app.router_rules import (
     identify_missing_fields,
     check_fraud_keywords,
     determine_route,
-    MANDATORY_FIELDS
+    MANDATORY_FIELDS,
+    MANDATORY_FIELDS_PARSED,
+    _FRAUD_CACHE_MAX_LENGTH,
+    _scan_fraud_keywords_cached
 )
 
 
@@ -67,41 +70,19 @@ class TestIdentifyMissingFields:
         missing = identify_missing_fields(claim)
         assert missing == []
     
-    def test_missing_policy_number(self):
-        """Test detection of missing policy number."""
-        claim = create_complete_claim(policy_number=None)
-        missing = identify_missing_fields(claim)
-        assert "policyInformation.policyNumber" in missing
-    
-    def test_missing_policyholder_name(self):
-        """Test detection of missing policyholder name."""
-        claim = create_complete_claim(policyholder_name=None)
-        missing = identify_missing_fields(claim)
-        assert "policyInformation.policyholderName" in missing
-    
-    def test_missing_incident_date(self):
-        """Test detection of missing incident date."""
-        claim = create_complete_claim(incident_date=None)
+    @pytest.mark.parametrize("override,expected", [
+        ({"policy_number": None}, "policyInformation.policyNumber"),
+        ({"policyholder_name": None}, "policyInformation.policyholderName"),
+        ({"incident_date": None}, "incidentInformation.date"),
+        ({"incident_description": None}, "incidentInformation.description"),
+        ({"claim_type": None}, "claimType"),
+        ({"estimated_damage": None}, "assetDetails.estimatedDamage"),
+    ])
+    def test_missing_single_field(self, override, expected):
+        """Test detection of each mandatory field when it alone is missing."""
+        claim = create_complete_claim(**override)
         missing = identify_missing_fields(claim)
-        assert "incidentInformation.date" in missing
-    
-    def test_missing_incident_description(self):
-        """Test detection of missing incident description."""
-        claim = create_complete_claim(incident_description=None)
-        missing = identify_missing_fields(claim)
-        assert "incidentInformation.description" in missing
-    
-    def test_missing_claim_type(self):
-        """Test detection of missing claim type."""
-        claim = create_complete_claim(claim_type=None)
-        missing = identify_missing_fields(claim)
-        assert "claimType" in missing
-    
-    def test_missing_estimated_damage(self):
-        """Test detection of missing estimated damage."""
-        claim = create_complete_claim(estimated_damage=None)
-        missing = identify_missing_fields(claim)
-        assert "assetDetails.estimatedDamage" in missing
+        assert missing == [expected]
     
     def test_multiple_missing_fields(self):
         """Test detection of multiple missing fields."""
@@ -115,6 +96,26 @@ class TestIdentifyMissingFields:
         assert "policyInformation.policyNumber" in missing
         assert "incidentInformation.date" in missing
         assert "claimType" in missing
+    
+    def test_missing_section_on_unvalidated_claim(self):
+        """Test that a None or absent section marks its fields as missing."""
+        complete = create_complete_claim()
+        claim = ExtractedFields.model_construct(
+            policyInformation=None,
+            incidentInformation=complete.incidentInformation,
+            involvedParties=complete.involvedParties,
+            claimType=complete.claimType
+        )
+        missing = identify_missing_fields(claim)
+        assert missing == [
+            "policyInformation.policyNumber",
+            "policyInformation.policyholderName",
+            "assetDetails.estimatedDamage"
+        ]
+    
+    def test_parsed_paths_match_mandatory_fields(self):
+        """Test that the pre-split paths mirror MANDATORY_FIELDS in order."""
+        assert [".".join(path) for path in MANDATORY_FIELDS_PARSED] == MANDATORY_FIELDS
 
 
 class TestCheckFraudKeywords:
@@ -146,6 +147,26 @@ class TestCheckFraudKeywords:
     def test_none_description(self):
         """Test that None description returns False."""
         assert check_fraud_keywords(None) is False
+    
+    def test_fraud_keyword_cached(self):
+        """Test that a repeated short description is answered from the cache."""
+        _scan_fraud_keywords_cached.cache_clear()
+        description = "Repeated description: possible fraud"
+        
+        assert check_fraud_keywords(description) is True
+        # An equal but distinct string object still hits the cache
+        assert check_fraud_keywords("".join(list(description))) is True
+        
+        info = _scan_fraud_keywords_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+    
+    def test_long_description_not_cached(self):
+        """Test that descriptions over the cache limit are scanned, not cached."""
+        _scan_fraud_keywords_cached.cache_clear()
+        description = "x" * _FRAUD_CACHE_MAX_LENGTH + " staged"
+        
+        assert check_fraud_keywords(description) is True
+        assert _scan_fraud_keywords_cached.cache_info().currsize == 0
 
 
 class TestDetermineRoute: